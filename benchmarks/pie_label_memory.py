@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Compares memory used by a single PieLabel with and without slots.
+
+PieLabel and its Animation are modeled by reference classes with the
+same attributes, in two variants: storing attributes in an instance
+__dict__ (as before the slots change), and in slots (as now). Fields
+must be kept in sync with `PieLabel` and `Animation` by hand.
+
+Before the change, each animation of a label also got its own no-op
+update callback. Now the default one, shared by all, is used.
+
+Qt objects are replaced with plain python placeholders, as memory owned
+by Qt is not affected by slots, and tracemalloc can't measure it anyway.
+That way the script runs with python alone:
+
+    python benchmarks/pie_label_memory.py
+"""
+
+import gc
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+LABELS_AMOUNT = 10_000
+REPEATS = 5
+
+
+def _no_update(_: float) -> None:
+    """Default update callback of Animation, shared by all instances."""
+
+
+class _AnimationTimeField:
+    """Config field read by animations of labels to get their duration."""
+
+    def read(self) -> float:
+        return 0.2
+
+
+_ANIMATION_TIME = _AnimationTimeField()
+
+
+def _init_animation(
+    self,
+    update_callback: Callable[[float], None] = _no_update,
+    duration_s_callback: Callable[[], float] = lambda: 0,
+) -> None:
+    """Set the same attributes as `Animation.__init__` does."""
+    self._update_callback = update_callback
+    self._duration_s_cb = duration_s_callback
+    self._start_time_ms = 0
+    self._initial_value = 0
+    self._duration_ms = 0
+    self._is_ascending = False
+    self._value = 0
+    self._is_running = False
+
+
+class DictAnimation:
+    """Animation storing its attributes in an instance __dict__."""
+
+    __init__ = _init_animation
+
+
+class SlotsAnimation:
+    """Animation storing its attributes in slots."""
+
+    __slots__ = (
+        "_update_callback",
+        "_duration_s_cb",
+        "_start_time_ms",
+        "_initial_value",
+        "_duration_ms",
+        "_is_ascending",
+        "_value",
+        "_is_running")
+
+    __init__ = _init_animation
+
+
+def _create_dict_animation() -> DictAnimation:
+    """Create animation of label, like it was done before the change."""
+    return DictAnimation(
+        update_callback=lambda _: None,
+        duration_s_callback=_ANIMATION_TIME.read)
+
+
+def _create_slots_animation() -> SlotsAnimation:
+    """Create animation of label, like it is done now."""
+    return SlotsAnimation(duration_s_callback=_ANIMATION_TIME.read)
+
+
+@dataclass
+class DictPieLabel:
+    """PieLabel storing its attributes in an instance __dict__."""
+
+    value: Any
+    display_value: Any = None
+    pretty_name: str = ""
+    center: tuple[int, int] = (0, 0)
+    angle: int = 0
+    activation_progress: DictAnimation = field(
+        default_factory=_create_dict_animation)
+
+
+@dataclass(slots=True)
+class SlotsPieLabel:
+    """PieLabel storing its attributes in slots."""
+
+    value: Any
+    display_value: Any = None
+    pretty_name: str = ""
+    center: tuple[int, int] = (0, 0)
+    angle: int = 0
+    activation_progress: SlotsAnimation = field(
+        default_factory=_create_slots_animation)
+
+
+def measure_bytes_per_label(label_class: type) -> float:
+    """Return memory allocated by python for each of created labels."""
+    # Values are created before measuring, as they are not part of label
+    names = [str(i) for i in range(LABELS_AMOUNT)]
+    gc.collect()
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    labels = [label_class(value=name, pretty_name=name) for name in names]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del labels
+    return (after - before) / LABELS_AMOUNT
+
+
+def median_bytes_per_label(label_class: type) -> float:
+    """Return median of repeated measurements."""
+    results = sorted(
+        measure_bytes_per_label(label_class) for _ in range(REPEATS))
+    return results[len(results)//2]
+
+
+def main() -> None:
+    before = median_bytes_per_label(DictPieLabel)
+    after = median_bytes_per_label(SlotsPieLabel)
+    print(f"Bytes per label, including its animation "
+          f"(median of {REPEATS} runs, {LABELS_AMOUNT} labels each):")
+    print(f"- before (__dict__): {before:.0f}")
+    print(f"- after (slots):     {after:.0f}")
+
+
+if __name__ == "__main__":
+    main()
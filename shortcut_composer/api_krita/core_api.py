@@ -10,10 +10,18 @@ from PyQt.QtWidgets import (
     QApplication,
     QMainWindow,
     QMdiArea)
-from PyQt.QtGui import QKeySequence, QColor, QIcon, QPalette, QGuiApplication
+from PyQt.QtGui import (
+    QKeySequence,
+    QColor,
+    QIcon,
+    QPalette,
+    QPixmap,
+    QGuiApplication)
 from PyQt.QtCore import QTimer
 
 from .wrappers import (
+    PresetThumbnailCache,
+    PresetIndex,
     ToolDescriptor,
     Document,
     Version,
@@ -33,6 +41,7 @@ class KritaInstance:
         scr = QGuiApplication.primaryScreen()
         self.screen_size = scr.size().width() if scr is not None else 1920
         self.main_window: Any = None
+        self._preset_thumbnails = PresetThumbnailCache()
 
     def get_active_view(self) -> View:
         """Return wrapper of krita `View`."""
@@ -63,8 +72,30 @@ class KritaInstance:
         return self.instance.action(action_name).shortcut()
 
     def get_presets(self) -> dict[str, Any]:
-        """Return a list of unwrapped preset objects"""
-        return self.instance.resources('preset')
+        """Return a list of unwrapped preset objects. Do not modify it."""
+        return PresetIndex.get_presets()
+
+    @property
+    def presets_generation(self) -> int:
+        """Return number which grows each time the presets change."""
+        PresetIndex.refresh_if_needed()
+        return PresetIndex.generation
+
+    def get_preset_thumbnail(self, name: str) -> QPixmap | None:
+        """Return preset thumbnail, cached on disk between sessions."""
+        return self._preset_thumbnails.get(name)
+
+    def prefetch_preset_thumbnails(
+        self,
+        names: list[str],
+        on_finished: Callable[[], None] = lambda: None,
+    ) -> None:
+        """Start decoding thumbnails of presets in a background thread."""
+        self._preset_thumbnails.prefetch(names, on_finished)
+
+    def cancel_preset_thumbnail_prefetch(self) -> None:
+        """Stop decoding thumbnails started with prefetch."""
+        self._preset_thumbnails.cancel_prefetch()
 
     def get_active_qwindow(self) -> QMainWindow:
         """Return qt window of krita. Don't use on plugin init phase."""
@@ -147,6 +178,11 @@ class KritaInstance:
         return QApplication.instance().palette().color(  # type: ignore
             QPalette.ColorRole.Highlight)
 
+    @property
+    def palette_key(self) -> int:
+        """Return key of the application palette which changes with theme."""
+        return QApplication.instance().palette().cacheKey()  # type: ignore
+
     @property
     def is_light_theme_active(self) -> bool:
         """Return if currently set theme is light using it's main color."""
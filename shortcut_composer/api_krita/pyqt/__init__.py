@@ -4,8 +4,10 @@
 """Wrappers and utilities based on PyQt objects."""
 
 from .animated_widget import AnimatedWidget, AnimationProcessor, Animation
+from .cursor_move_event_filter import CursorMoveEventFilter
 from .safe_confirm_button import SafeConfirmButton
 from .pixmap_transform import PixmapTransform
+from .pixmap_cache import PixmapCache
 from .round_button import RoundButton
 from .base_widget import BaseWidget
 from .painter import Painter
@@ -15,8 +17,10 @@ __all__ = [
     "AnimationProcessor",
     "AnimatedWidget",
     "Animation",
+    "CursorMoveEventFilter",
     "SafeConfirmButton",
     "PixmapTransform",
+    "PixmapCache",
     "RoundButton",
     "BaseWidget",
     "Painter",
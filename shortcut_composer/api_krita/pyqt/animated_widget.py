@@ -108,8 +108,20 @@ class Animation:
 
     It is possible to register a callback performing some operation on
     current `value` when `update()` is called. 
+
+    Attributes are stored in slots, as there can be many animations.
     """
 
+    __slots__ = (
+        "_update_callback",
+        "_duration_s_cb",
+        "_start_time_ms",
+        "_initial_value",
+        "_duration_ms",
+        "_is_ascending",
+        "_value",
+        "_is_running")
+
     def __init__(
         self,
         update_callback: Callable[[float], None] = lambda _: None,
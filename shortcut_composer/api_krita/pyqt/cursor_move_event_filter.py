@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Callable, Literal
+
+from PyQt.QtCore import QEvent, QObject
+from PyQt.QtWidgets import QApplication
+
+EmptyCallback = Callable[[], None]
+
+
+class CursorMoveEventFilter(QObject):
+    """
+    Application-wide event filter running a callback on cursor movement.
+
+    Mouse, tablet and hover movement delivered to any window of the
+    application is recognized, so the callback only runs when cursor
+    actually moves. Has the same interface as `Timer`, which allows to
+    replace polling with it.
+
+    Events are never consumed by the filter.
+    """
+
+    MOVE_EVENTS = {
+        QEvent.Type.MouseMove,
+        QEvent.Type.TabletMove,
+        QEvent.Type.HoverMove}
+    """Types of events which mean that the cursor has moved."""
+
+    def __init__(self, target: EmptyCallback) -> None:
+        super().__init__(None)
+        self._target = target
+        self._installed = False
+
+    def start(self) -> None:
+        """Start running the callback on cursor movement."""
+        if not self._installed:
+            QApplication.instance().installEventFilter(self)  # type: ignore
+            self._installed = True
+
+    def stop(self) -> None:
+        """Stop running the callback on cursor movement."""
+        if self._installed:
+            QApplication.instance().removeEventFilter(self)  # type: ignore
+            self._installed = False
+
+    def eventFilter(self, _, event: QEvent) -> Literal[False]:
+        """Run the callback when the event is a movement of the cursor."""
+        if event.type() in self.MOVE_EVENTS:
+            self._target()
+        return False
@@ -3,9 +3,14 @@
 
 import math
 
-from PyQt.QtGui import QPainter, QPainterPath, QColor, QPixmap, QPaintEvent
+from PyQt.QtGui import (
+    QPainter,
+    QPainterPath,
+    QColor,
+    QPixmap,
+    QPaintEvent,
+    QPaintDevice)
 from PyQt.QtCore import QPoint, QRectF, QPointF
-from PyQt.QtWidgets import QWidget
 
 
 class Painter:
@@ -16,13 +21,22 @@ class Painter:
     - wheel of given thickness, color and radius
     - pie being a part of a wheel
     - pixmap providing a center instead of top-left corner
+    - layer pre-rendered into a pixmap of the painted device size
+
+    Paints on a widget during its paint event, or on any other paint
+    device like `QPixmap` when no event is given.
 
     Unlike original painter, can be used with context manager.
     """
 
-    def __init__(self, widget: QWidget, event: QPaintEvent) -> None:
-        self._painter = QPainter(widget)
-        self._painter.eraseRect(event.rect())
+    def __init__(
+        self,
+        device: QPaintDevice,
+        event: QPaintEvent | None = None,
+    ) -> None:
+        self._painter = QPainter(device)
+        if event is not None:
+            self._painter.eraseRect(event.rect())
         self._painter.setRenderHints(QPainter.RenderHint.Antialiasing)
 
     def paint_wheel(
@@ -77,12 +91,16 @@ class Painter:
             pixmap.height(),
             pixmap)
 
+    def paint_layer(self, pixmap: QPixmap) -> None:
+        """Paint pixmap at top-left corner respecting its pixel ratio."""
+        self._painter.drawPixmap(0, 0, pixmap)
+
     def _square(self, center: QPoint, width: int) -> QRectF:
         """Return a square of given `width` at `center` point."""
         return QRectF(center.x()-width//2, center.y()-width//2, width, width)
 
     def end(self) -> None:
-        """End painting a widget provided in __init__."""
+        """End painting a device provided in __init__."""
         self._painter.end()
 
     def __enter__(self) -> 'Painter':
@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from PyQt.QtGui import QPixmap
+
+
+class SharedPixmapCache:
+    """
+    Process-wide cache of pixmaps prepared for display.
+
+    Pixmaps are stored under keys which should describe everything the
+    prepared pixmap depends on, like the displayed value, its size in
+    pixels, device pixel ratio and shape.
+
+    When total size of stored pixmaps exceeds the memory budget, the
+    least recently used ones are evicted.
+    """
+
+    def __init__(self, memory_budget_mb: int) -> None:
+        self._budget = memory_budget_mb * 1024 * 1024
+        self._used = 0
+        self._pixmaps: OrderedDict[Hashable, QPixmap] = OrderedDict()
+
+    def get(self, key: Hashable, create: Callable[[], QPixmap]) -> QPixmap:
+        """Return pixmap stored under key, creating it when missing."""
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            return pixmap
+
+        pixmap = create()
+        self._pixmaps[key] = pixmap
+        self._used += self._size_of(pixmap)
+        self._evict()
+        return pixmap
+
+    def clear(self) -> None:
+        """Remove all stored pixmaps, so they get created again."""
+        self._pixmaps.clear()
+        self._used = 0
+
+    def _evict(self) -> None:
+        """Remove least recently used pixmaps until budget is met."""
+        while self._used > self._budget and len(self._pixmaps) > 1:
+            _, pixmap = self._pixmaps.popitem(last=False)
+            self._used -= self._size_of(pixmap)
+
+    @staticmethod
+    def _size_of(pixmap: QPixmap) -> int:
+        """Return amount of bytes taken by the pixmap data."""
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+PixmapCache = SharedPixmapCache(memory_budget_mb=64)
+"""Pixmaps of labels shared by all the widgets of the plugin."""
@@ -7,6 +7,8 @@ Wrappers of classes in krita API.
 Adds typing, docstrings and changes the interface to be PEP8 compatible.
 """
 
+from .preset_thumbnail_cache import PresetThumbnailCache
+from .preset_index import PresetIndex
 from .tool_descriptor import ToolDescriptor
 from .database import Database
 from .document import Document
@@ -17,6 +19,8 @@ from .node import Node
 from .view import View
 
 __all__ = [
+    "PresetThumbnailCache",
+    "PresetIndex",
     "ToolDescriptor",
     "Database",
     "Document",
@@ -5,13 +5,43 @@ import os.path
 from typing import Any
 
 from krita import Krita as Api
+from PyQt.QtCore import QTimer
 from PyQt.QtSql import QSqlDatabase, QSqlQuery
 
 
 class Database:
-    """Explorer of the database with krita resources."""
+    """
+    Explorer of the database with krita resources.
+
+    Connection is read-only and persistent. It is opened once and shared
+    by all instances, and queries get prepared once and reused. Leaving
+    the context manager does not close it. Connection is closed and
+    opened again only when a query fails.
+
+    Brush tags and presets belonging to them are loaded at once into
+    an index shared by all instances. It is loaded again only when the
+    database file was modified since.
+
+    Path to the database file is read from kritarc once, and again only
+    when the connection gets reopened. Modification time of the file is
+    checked at most once per pass of the event loop.
+    """
 
     connection_name = "ShortcutComposer"
+    _queries: dict[str, QSqlQuery] = {}
+    """Prepared queries mapped to their SQL text."""
+    _tag_index: dict[str, list[str]] = {}
+    """Tag names mapped to names of presets which belong to them."""
+    _brush_tags: list[str] = []
+    """Names of active brush tags, sorted alphabetically."""
+    _index_mtime: float | None = None
+    """Modification time of database file when the index was loaded."""
+    _file_path: str | None = None
+    """Path to the database file, read from kritarc."""
+    _mtime: float | None = None
+    """Modification time of database file in this event loop pass."""
+    _mtime_checked = False
+    """Whether modification time was checked in this event loop pass."""
 
     def __init__(self) -> None:
         self.connect_if_needed()
@@ -23,46 +53,132 @@ class Database:
             return
 
         cls.database = QSqlDatabase.addDatabase("QSQLITE", cls.connection_name)
-        path = Api.instance().readSetting("", "ResourceDirectory", "")
-        path = os.path.join(path, "resourcecache.sqlite")
-        cls.database.setDatabaseName(path)
+        cls.database.setDatabaseName(cls.file_path())
+        cls.database.setConnectOptions("QSQLITE_OPEN_READONLY")
 
-    def _single_column_query(self, sql_query: str, value: str) -> list[Any]:
-        """Use SQL query to get single column in a form of a list."""
-        if not self.database.open():
-            return []
-
-        query_handler = QSqlQuery(self.database)
-        if not query_handler.exec(sql_query):
-            return []
+    @classmethod
+    def file_path(cls) -> str:
+        """Return path to the sqlite file of krita resource database."""
+        if cls._file_path is None:
+            path = Api.instance().readSetting("", "ResourceDirectory", "")
+            cls._file_path = os.path.join(path, "resourcecache.sqlite")
+        return cls._file_path
 
-        return_list = []
-        while query_handler.next():
-            return_list.append(query_handler.value(value))
+    @classmethod
+    def modification_time(cls) -> float | None:
+        """Return modification time of database file. None if missing."""
+        if cls._mtime_checked:
+            return cls._mtime
+
+        cls._mtime_checked = True
+        QTimer.singleShot(0, cls._forget_modification_time)
+        try:
+            cls._mtime = os.path.getmtime(cls.file_path())
+        except OSError:
+            cls._mtime = None
+        return cls._mtime
 
-        query_handler.finish()
-        return return_list
+    @classmethod
+    def _forget_modification_time(cls) -> None:
+        """Make the next call check the modification time again."""
+        cls._mtime_checked = False
+
+    def _query(
+        self,
+        sql_query: str,
+        columns: list[str],
+        **bindings: Any,
+    ) -> list[tuple[Any, ...]]:
+        """
+        Run prepared SQL query and return rows with requested columns.
+
+        Bindings are passed as values of named placeholders. When the
+        query fails, the connection is opened again and the query is
+        repeated once.
+        """
+        for _ in range(2):
+            query_handler = self._prepared(sql_query)
+            if query_handler is None:
+                self.close()
+                continue
+
+            for name, value in bindings.items():
+                query_handler.bindValue(f":{name}", value)
+
+            if not query_handler.exec():
+                self.close()
+                continue
+
+            return_list = []
+            while query_handler.next():
+                return_list.append(
+                    tuple(query_handler.value(c) for c in columns))
+
+            query_handler.finish()
+            return return_list
+        return []
+
+    def _prepared(self, sql_query: str) -> QSqlQuery | None:
+        """Return query prepared on open connection. None on failure."""
+        if not self.database.isOpen() and not self.database.open():
+            return None
+
+        if sql_query not in self._queries:
+            query_handler = QSqlQuery(self.database)
+            if not query_handler.prepare(sql_query):
+                return None
+            self._queries[sql_query] = query_handler
+        return self._queries[sql_query]
+
+    def get_preset_versions(self) -> dict[str, str]:
+        """Return md5 and version of latest file of each preset by name."""
+        sql_query = '''
+            SELECT r.name AS preset, vr.md5sum AS md5, vr.version AS version
+            FROM resources r
+                JOIN resource_types rt
+                    ON r.resource_type_id = rt.id
+                JOIN versioned_resources vr
+                    ON vr.resource_id = r.id
+            WHERE
+                rt.name = "paintoppresets"
+                AND r.status = 1
+            ORDER BY vr.version
+        '''
+        rows = self._query(sql_query, ["preset", "md5", "version"])
+        return {name: f"{md5}-{version}" for name, md5, version in rows}
 
     def get_preset_names_from_tag(self, tag_name: str) -> list[str]:
         """Return list of all preset names that belong to given tag."""
-        tag_name = tag_name.replace("\"", "\"\"")
-        sql_query = f'''
-            SELECT DISTINCT r.name AS preset
+        self._load_index_if_needed()
+        return self._tag_index.get(tag_name, []).copy()
+
+    def get_brush_tags(self) -> list[str]:
+        "Return list of all tag names."
+        self._load_index_if_needed()
+        return self._brush_tags.copy()
+
+    def _load_index_if_needed(self) -> None:
+        """Load tags and their presets when the database was modified."""
+        mtime = self.modification_time()
+        if mtime is not None and mtime == Database._index_mtime:
+            return
+
+        sql_query = '''
+            SELECT t.name AS tag, r.name AS preset
             FROM tags t
                 JOIN resource_tags rt
                     ON t.id = rt.tag_id
                 JOIN resources r
                     ON r.id = rt.resource_id
             WHERE
-                t.name="{tag_name}"
-                AND rt.active = 1
+                rt.active = 1
         '''
-        return self._single_column_query(sql_query, "preset")
+        tag_index: dict[str, dict[str, None]] = {}
+        for tag, preset in self._query(sql_query, ["tag", "preset"]):
+            tag_index.setdefault(tag, {})[preset] = None
 
-    def get_brush_tags(self) -> list[str]:
-        "Return list of all tag names."
         sql_query = '''
-            SELECT DISTINCT t.name AS tag 
+            SELECT DISTINCT t.name AS tag
             FROM tags t
                 JOIN resource_types rt
                     ON t.resource_type_id = rt.id
@@ -70,17 +186,30 @@ class Database:
                 t.active = 1
                 AND rt.name = "paintoppresets"
         '''
-        presets = self._single_column_query(sql_query, "tag")
-        return sorted(presets, key=str.lower)
+        brush_tags = [row[0] for row in self._query(sql_query, ["tag"])]
+
+        Database._tag_index = {
+            tag: list(presets) for tag, presets in tag_index.items()}
+        Database._brush_tags = sorted(brush_tags, key=str.lower)
+        # Empty result can come from a failed query, so it is not kept
+        Database._index_mtime = mtime if brush_tags else None
 
     def close(self) -> None:
-        """Close the connection with the database."""
+        """
+        Close the connection and forget queries prepared on it.
+
+        Path to the database is read again, as it could have changed.
+        """
+        for query_handler in self._queries.values():
+            query_handler.finish()
+        self._queries.clear()
         self.database.close()
+        Database._file_path = None
+        self.database.setDatabaseName(self.file_path())
 
     def __enter__(self) -> 'Database':
         """Return self. Connection already initialized in init."""
         return self
 
     def __exit__(self, *_) -> None:
-        """Close the connection with the database on exit."""
-        self.close()
+        """Keep the connection open, so it can be reused."""
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Any
+
+from krita import Krita as Api
+from .database import Database
+
+
+class PresetIndex:
+    """
+    Mapping of preset names to krita preset objects shared by the plugin.
+
+    Krita creates a new object for every preset each time the mapping is
+    requested, so it is built once and shared. It gets built again only
+    after the resource database file was modified, which happens when
+    resources are added, removed or edited.
+
+    `generation` grows with each rebuild, so other caches can detect
+    that they need to be refreshed as well.
+    """
+
+    _presets: dict[str, Any] | None = None
+    _database_mtime: float | None = None
+    generation = 0
+
+    @classmethod
+    def get_presets(cls) -> dict[str, Any]:
+        """Return mapping of preset names to krita preset objects."""
+        cls.refresh_if_needed()
+        return cls._presets  # type: ignore
+
+    @classmethod
+    def refresh_if_needed(cls) -> None:
+        """Build the mapping again if the database was modified."""
+        mtime = Database.modification_time()
+        if (cls._presets is not None
+                and mtime is not None
+                and mtime == cls._database_mtime):
+            return
+
+        cls._database_mtime = mtime
+        cls._presets = Api.instance().resources('preset')
+        cls.generation += 1
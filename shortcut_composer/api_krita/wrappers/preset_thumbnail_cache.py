@@ -0,0 +1,253 @@
+# SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+from hashlib import sha1
+from typing import Callable, Iterable
+
+from PyQt.QtCore import (
+    Qt,
+    QStandardPaths,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    QObject,
+    pyqtSignal)
+from PyQt.QtGui import QPixmap, QImage
+
+from ..pyqt import PixmapCache
+from .database import Database
+from .preset_index import PresetIndex
+
+
+class PresetThumbnailCache:
+    """
+    Stores preset thumbnails on disk, to reuse them in sessions.
+
+    Files are placed in the user cache directory. Their names consist of
+    hashed preset name, md5 and version of preset file, and thumbnail
+    size, so an edited preset never uses an outdated thumbnail.
+
+    Versions of presets are read from the resource database in a single
+    query, repeated only when the PresetIndex got rebuilt. It is checked
+    once per pass of the event loop, so not for every label. Then the
+    thumbnails which no longer match any preset are removed, and the
+    shared PixmapCache is cleared, as it may hold outdated images. When
+    the query returns nothing, it is treated as failed: no files are
+    removed, and the query is repeated on next access.
+
+    Thumbnails are stored square. Making them round is left to widgets
+    which display them.
+
+    Thumbnails are read from disk lazily, when first requested. Krita
+    resources are used only for presets missing in the cache. Files of
+    such thumbnails are written on a QThreadPool worker.
+
+    Reading can be started in advance with `prefetch`, which decodes
+    the stored files to QImages on a QThreadPool worker. QPixmaps can
+    be created only in the main thread, so they are converted from
+    decoded images once requested. Prefetches do not cancel each other,
+    so that callers can prefetch ahead. Decoded images are kept until
+    they are requested, or `cancel_prefetch` is called.
+    """
+
+    SIZE = 256
+    """Size [px] of stored thumbnails."""
+
+    def __init__(self) -> None:
+        self._directory = os.path.join(
+            QStandardPaths.writableLocation(
+                QStandardPaths.StandardLocation.CacheLocation),
+            "ShortcutComposer",
+            "presets")
+        self._versions: dict[str, str] = {}
+        self._index_generation: int | None = None
+        self._versions_checked = False
+        self._decoded: dict[str, QImage] = {}
+        self._decoders: list[_ThumbnailDecoder] = []
+
+    def get(self, name: str) -> QPixmap | None:
+        """Return thumbnail of preset with given name, or None if missing."""
+        self._refresh_versions()
+        version = self._versions.get(name)
+        if version is None:
+            return self._from_resources(name)
+
+        path = os.path.join(self._directory, self._file_name(name, version))
+        image = self._decoded.pop(path, None)
+        pixmap = QPixmap(path) if image is None else QPixmap.fromImage(image)
+        if not pixmap.isNull():
+            return pixmap
+
+        image = self._image_from_resources(name)
+        if image is None:
+            return None
+        QThreadPool.globalInstance().start(_ThumbnailWriter(path, image))
+        return QPixmap.fromImage(image)
+
+    def prefetch(
+        self,
+        names: Iterable[str],
+        on_finished: Callable[[], None] = lambda: None,
+    ) -> None:
+        """
+        Decode stored thumbnails of given presets in a background thread.
+
+        `on_finished` is called in the main thread once all the files
+        were decoded, or the prefetch was cancelled.
+        """
+        self._refresh_versions()
+        paths = [
+            os.path.join(self._directory, self._file_name(name, version))
+            for name in names
+            if (version := self._versions.get(name)) is not None]
+        decoder = _ThumbnailDecoder(paths, self._decoded)
+
+        # Decoders are owned here, so they must live until they finish
+        def forget_decoder() -> None:
+            decoder.done = True
+            self._decoders.remove(decoder)
+        decoder.signals.finished.connect(forget_decoder)
+        decoder.signals.finished.connect(on_finished)
+        self._decoders.append(decoder)
+        QThreadPool.globalInstance().start(decoder)
+
+    def cancel_prefetch(self) -> None:
+        """Stop all prefetches and forget images not requested yet."""
+        for decoder in self._decoders:
+            decoder.cancel()
+        self._decoded = {}
+
+    def _from_resources(self, name: str) -> QPixmap | None:
+        """Create the thumbnail from krita preset resource."""
+        image = self._image_from_resources(name)
+        if image is None:
+            return None
+        return QPixmap.fromImage(image)
+
+    def _image_from_resources(self, name: str) -> QImage | None:
+        """Create the thumbnail image from krita preset resource."""
+        try:
+            image = PresetIndex.get_presets()[name].image()
+        except KeyError:
+            return None
+        return image.scaled(
+            self.SIZE,
+            self.SIZE,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation)
+
+    def _refresh_versions(self) -> None:
+        """Read preset versions again when the database was modified."""
+        if self._versions_checked:
+            return
+        self._versions_checked = True
+        QTimer.singleShot(0, self._forget_versions_check)
+
+        PresetIndex.refresh_if_needed()
+        if PresetIndex.generation == self._index_generation:
+            return
+
+        with Database() as database:
+            versions = database.get_preset_versions()
+        if not versions:
+            # Failed query must not remove thumbnails. Retry next time.
+            return
+
+        self._index_generation = PresetIndex.generation
+        self._versions = versions
+        PixmapCache.clear()
+        self._remove_outdated_files()
+
+    def _forget_versions_check(self) -> None:
+        """Make the next access check the versions again."""
+        self._versions_checked = False
+
+    def _remove_outdated_files(self) -> None:
+        """Remove thumbnails of presets which no longer exist."""
+        valid = {self._file_name(name, version)
+                 for name, version in self._versions.items()}
+        try:
+            file_names = os.listdir(self._directory)
+        except OSError:
+            return
+        for file_name in file_names:
+            if file_name not in valid:
+                try:
+                    os.remove(os.path.join(self._directory, file_name))
+                except OSError:
+                    pass
+
+    def _file_name(self, name: str, version: str) -> str:
+        """Return name of thumbnail file for given preset version."""
+        name_hash = sha1(name.encode("utf-8")).hexdigest()
+        return f"{name_hash}-{version}-{self.SIZE}px.png"
+
+
+class _ThumbnailDecoder(QRunnable):
+    """
+    Decodes thumbnail files to QImages, which is safe outside main thread.
+
+    Images are put into the passed dictionary, mapped to their paths.
+    Cancelling replaces the dictionary in the cache, so that cancelled
+    decoders can't put images into the one used by the next prefetches.
+
+    Finishing is reported with a signal, which is delivered in the
+    thread of the signals object, so in the main thread. The `done`
+    flag is set by the cache, once the signal got delivered.
+    """
+
+    def __init__(self, paths: list[str], decoded: dict[str, QImage]) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self._paths = paths
+        self._decoded = decoded
+        self._cancelled = False
+        self.done = False
+        self.signals = _DecoderSignals()
+
+    def cancel(self) -> None:
+        """Stop decoding before the next file."""
+        self._cancelled = True
+
+    def run(self) -> None:
+        """Decode files until all are done or the decoder is cancelled."""
+        try:
+            for path in self._paths:
+                if self._cancelled:
+                    return
+                image = QImage(path)
+                if not image.isNull():
+                    self._decoded[path] = image
+        finally:
+            self.signals.finished.emit()
+
+
+class _ThumbnailWriter(QRunnable):
+    """Writes thumbnail image to a file, which is safe outside main thread."""
+
+    def __init__(self, path: str, image: QImage) -> None:
+        super().__init__()
+        self._path = path
+        self._image = image
+
+    def run(self) -> None:
+        """
+        Create the cache directory if needed, and write the file.
+
+        File is written under a temporary name and then renamed, so that
+        the main thread never reads a partially written file.
+        """
+        temporary_path = f"{self._path}.{id(self)}.part"
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            if self._image.save(temporary_path, "PNG"):
+                os.replace(temporary_path, self._path)
+        except OSError:
+            pass
+
+
+class _DecoderSignals(QObject):
+    """Signals of _ThumbnailDecoder, which as QRunnable has none."""
+
+    finished = pyqtSignal()
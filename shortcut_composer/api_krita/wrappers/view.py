@@ -3,12 +3,12 @@
 
 from dataclasses import dataclass
 from typing import Protocol
-from functools import cached_property
 
 from PyQt.QtGui import QColor
 
-from krita import Krita as Api, ManagedColor
+from krita import ManagedColor
 from .canvas import KritaCanvas
+from .preset_index import PresetIndex
 from ..enums import BlendingMode
 
 
@@ -50,10 +50,10 @@ class View:
 
     view: KritaView
 
-    @cached_property
+    @property
     def preset_map(self) -> dict[str, _KritaPreset]:
         """Return dictionary mapping preset names to krita preset objects."""
-        return Api.instance().resources('preset')
+        return PresetIndex.get_presets()
 
     @property
     def brush_preset(self) -> str:
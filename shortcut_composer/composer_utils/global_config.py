@@ -33,6 +33,16 @@ class GlobalConfig(FieldGroup):
         self.FPS_LIMIT = self.field(
             name="FPS limit",
             default=60)
+        self.WARM_UP_ACTIONS = self.field(
+            name="Warm up actions",
+            default=False)
+        self.RECENTLY_USED_ACTIONS = self.field(
+            name="Recently used actions",
+            default=[],
+            parser_type=str)
+        self.PACK_DOCUMENT_SETTINGS = self.field(
+            name="Pack document settings",
+            default=False)
 
         self.PIE_GLOBAL_SCALE = self.field(
             name="Pie global scale",
@@ -43,6 +53,9 @@ class GlobalConfig(FieldGroup):
         self.PIE_DEADZONE_GLOBAL_SCALE = self.field(
             name="Pie deadzone global scale",
             default=1.0)
+        self.POLL_PIE_CURSOR = self.field(
+            name="Poll pie cursor",
+            default=False)
         self.PIE_ANIMATION_TIME = self.field(
             name="Pie animation time",
             default=0.2)
@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Protocol, Generic, TypeVar
+from typing import Callable, Protocol, Generic, TypeVar
 
 T = TypeVar("T")
 
@@ -46,3 +46,20 @@ class GroupManager(Protocol, Generic[T]):
         Use group 'All' to get value from all the groups.
         """
         ...
+
+    def prefetch(
+        self,
+        values: list[T],
+        on_finished: Callable[[], None],
+    ) -> None:
+        """
+        Start preparing data needed to display the values in background.
+
+        `on_finished` is called in the main thread when the data is
+        ready. It may be called before the method returns.
+        """
+        ...
+
+    def cancel_prefetch(self) -> None:
+        """Stop preparing data and forget the data not used yet."""
+        ...
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from enum import Enum
+from typing import Callable
 
 from api_krita.enums.helpers import EnumGroup
 from composer_utils import GroupOrderHolder
@@ -48,3 +49,14 @@ class EnumGroupManager(GroupManager[EnumGroup]):
         missing = [v for v in from_krita if v not in from_config]
 
         return known_order + missing
+
+    def prefetch(
+        self,
+        values: list[Enum],
+        on_finished: Callable[[], None],
+    ) -> None:
+        """Report being finished, as enum icons are cheap to create."""
+        on_finished()
+
+    def cancel_prefetch(self) -> None:
+        """Do nothing, as nothing is being prepared."""
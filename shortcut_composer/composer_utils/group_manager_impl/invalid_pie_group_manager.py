@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from typing import Callable
+
 from ..group_manager import GroupManager
 
 
@@ -17,3 +19,10 @@ class InvalidGroupManager(GroupManager):
     def values_from_group(self, group: str, sort: bool = True) -> list:
         """Return empty list."""
         return []
+
+    def prefetch(self, values: list, on_finished: Callable[[], None]) -> None:
+        """Report being finished, as there are no values to prepare."""
+        on_finished()
+
+    def cancel_prefetch(self) -> None:
+        """Do nothing, as nothing is being prepared."""
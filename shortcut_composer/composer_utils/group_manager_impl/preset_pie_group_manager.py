@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from typing import Callable
+
 from api_krita import Krita
 from api_krita.wrappers import Database
 from composer_utils import GroupOrderHolder
@@ -42,3 +44,15 @@ class PresetGroupManager(GroupManager[str]):
         missing = [p for p in from_krita if p not in from_config]
 
         return preset_order + missing
+
+    def prefetch(
+        self,
+        values: list[str],
+        on_finished: Callable[[], None],
+    ) -> None:
+        """Start decoding thumbnails of given presets in background."""
+        Krita.prefetch_preset_thumbnails(values, on_finished)
+
+    def cancel_prefetch(self) -> None:
+        """Stop decoding preset thumbnails."""
+        Krita.cancel_preset_thumbnail_prefetch()
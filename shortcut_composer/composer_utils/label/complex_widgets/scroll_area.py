@@ -1,8 +1,9 @@
 # SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import re
-from typing import Sequence, TypeVar, Generic
+from collections import deque
+from collections.abc import Hashable
+from typing import Any, Callable, Sequence, TypeVar, Generic
 
 from PyQt.QtCore import Qt, QTimer, QEvent, pyqtSignal
 from PyQt.QtWidgets import (
@@ -14,54 +15,94 @@ from PyQt.QtWidgets import (
     QWidget,
     QLabel)
 
+from config_system import CallbackScope
 from ...global_config import Config
 from ..label_widget import LabelWidget, WidgetInstructions
 from ..label_widget_style import LabelWidgetStyle
 from ..label_widget_impl import dispatch_label_widget
 from ..label_interface import LabelInterface
-from .scroll_area_utils import OffsetGridLayout
+from .scroll_area_utils import OffsetGridLayout, SearchIndex
 
 T = TypeVar("T", bound=LabelInterface, contravariant=True)
+Prefetch = Callable[[list, Callable[[], None]], None]
 
 
 class ScrollArea(QWidget, Generic[T]):
     """
     Widget containing a scrollable list of PieWidgets.
 
-    Widgets are defined with replace_handled_labels method which
-    creates the widgets representing them if needed. Using the method
-    again will replace handled widgets with new ones representing newer
-    passed labels.
+    Labels are defined with replace_handled_labels method. Using the
+    method again will replace handled labels with newer passed ones.
 
-    All the created widgets are stored in case they may need to be
-    reused when labels change again.
+    The grid is virtualized: widgets exist only for the rows visible in
+    the viewport, and a margin of row groups above and below it. Rows
+    outside of it are represented by the layout margin and the minimal
+    height of the scrolled widget. When scrolling, widgets of labels
+    which went out of sight are recycled to display the new ones, so
+    the amount of widgets does not depend on the amount of labels.
 
-    Currently handled widgets are publicly available, so that the
-    class owner can change their state (draggable, enabled).
+    Values used in the pie are marked with mark_used_values method,
+    which makes their widgets disabled, also when they get created or
+    recycled later. Only widgets which values started or stopped being
+    used are changed, and they get repainted together.
 
     ScrollArea comes with embedded QLabel showing the name of the
     children widget over which mouse was hovered, and a filter bar.
 
-    Writing something to the filter results in widgets which do not
-    match the phrase to not be displayed. Hidden widgets, are still
-    available under children_list.
+    Writing something to the filter results in labels which do not
+    match the phrase to not be displayed. Labels are looked for in the
+    SearchIndex built when they are handled, and filtering is delayed
+    to the next event loop turn, so that fast typing filters only once.
+
+    Large groups can be loaded with load_handled_values method instead.
+    Labels are then created in chunks, one chunk per event loop turn,
+    so that the UI stays responsive. Each chunk is created once its
+    data was prefetched in background, which happens while the previous
+    chunk is being created. Value
+    label displays a placeholder until the loading is finished. Loading
+    gets cancelled when handled labels are replaced again.
+
+    Callbacks registered on global config are registered through the
+    `callback_scope`, so that the owner can unregister them when the
+    widget is no longer used.
     """
 
     widgets_changed = pyqtSignal()
 
+    LOAD_CHUNK_SIZE = 24
+    """Amount of labels created in a single event loop turn."""
+    MARGIN_GROUPS = 1
+    """Amount of row groups with widgets above and below the viewport."""
+
     def __init__(
         self,
         label_style: LabelWidgetStyle = LabelWidgetStyle(),
         columns: int = 3,
+        callback_scope: CallbackScope | None = None,
     ) -> None:
         super().__init__(None)
         self._label_style = label_style
         self._columns = columns
+        self._callback_scope = (
+            callback_scope if callback_scope is not None else CallbackScope())
 
+        self._search_index = SearchIndex()
+        self._shown_labels: list[LabelInterface] = []
+        self._used_values: set[Hashable] = set()
         self._known_children: dict[LabelInterface, LabelWidget[T]] = {}
-        self._children_list: list[LabelWidget[T]] = []
-
-        self._grid = OffsetGridLayout(self._columns, self)
+        self._unused_children: dict[type, list[LabelWidget[T]]] = {}
+
+        self._pending_values: deque[Any] = deque()
+        self._prefetched_chunks: deque[list] = deque()
+        self._load_id = 0
+        self._create_labels: Callable[[list], list[LabelInterface]]
+        self._create_labels = lambda values: []
+        self._prefetch: Prefetch = lambda values, on_finished: on_finished()
+        self._cancel_prefetch: Callable[[], None] = lambda: None
+
+        self._internal = QWidget()
+        self._grid = OffsetGridLayout(self._columns, self._internal)
+        self._grid_margins = self._grid.contentsMargins()
         self._value_label = self._init_value_label()
         self._search_bar = self._init_search_bar()
         self._layout = self._init_layout()
@@ -82,7 +123,8 @@ class ScrollArea(QWidget, Generic[T]):
         footer.addWidget(self._search_bar, 1)
 
         layout = QVBoxLayout()
-        layout.addWidget(self._init_scroll_area())
+        self._area = self._init_scroll_area()
+        layout.addWidget(self._area)
         layout.addLayout(footer)
         return layout
 
@@ -95,22 +137,23 @@ class ScrollArea(QWidget, Generic[T]):
             # NOTE: Size is fixed due to issue in Qt5 under Windows 10
             label.setFixedWidth(self._label_style.icon_radius*4)
             label.setFixedHeight(label.sizeHint().height()*2)
-        Config.PIE_ICON_GLOBAL_SCALE.register_callback(reset_size)
+        self._callback_scope.register(Config.PIE_ICON_GLOBAL_SCALE, reset_size)
         reset_size()
 
         return label
 
     def _init_scroll_area(self) -> QScrollArea:
         """Create a widget, which scrolls internal widget with grid layout."""
-        internal = QWidget()
-        internal.setLayout(self._grid)
+        self._internal.setLayout(self._grid)
 
         area = QScrollArea()
         area.setHorizontalScrollBarPolicy(
             Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
         area.setWidgetResizable(True)
-        area.setWidget(internal)
+        area.setWidget(self._internal)
+        area.verticalScrollBar().valueChanged.connect(
+            lambda _: self._refresh_visible_children())
         QScroller.grabGesture(
             area.viewport(),
             QScroller.ScrollerGestureType.MiddleMouseButtonGesture)
@@ -120,7 +163,13 @@ class ScrollArea(QWidget, Generic[T]):
             radius = self._label_style.icon_radius
             area.setMinimumWidth(round(radius*self._columns*2.3))
             area.setFixedHeight(round(radius*9.2))
-        Config.PIE_ICON_GLOBAL_SCALE.register_callback(reset_size)
+
+        def on_scale_change() -> None:
+            # Visible rows depend on their height, which just changed
+            reset_size()
+            self._refresh_visible_children()
+        self._callback_scope.register(
+            Config.PIE_ICON_GLOBAL_SCALE, on_scale_change)
         reset_size()
 
         return area
@@ -130,63 +179,198 @@ class ScrollArea(QWidget, Generic[T]):
         search_bar = QLineEdit(self)
         search_bar.setPlaceholderText("Search")
         search_bar.setClearButtonEnabled(True)
-        search_bar.textChanged.connect(self.apply_search_bar_filter)
+        filter_timer = QTimer(self)
+        filter_timer.setSingleShot(True)
+        filter_timer.setInterval(0)
+        filter_timer.timeout.connect(self.apply_search_bar_filter)
+        search_bar.textChanged.connect(filter_timer.start)
         return search_bar
 
     def apply_search_bar_filter(self) -> None:
         """Replace widgets in layout with those that match the filter."""
         self.setUpdatesEnabled(False)
-        pattern = re.escape(self._search_bar.text())
-        regex = re.compile(pattern, flags=re.IGNORECASE)
-
-        children = [child for child in self._children_list
-                    if regex.search(child.label.pretty_name)]
+        self._shown_labels = self._search_index.search(
+            self._search_bar.text())
+        self._refresh_visible_children()
+        QTimer.singleShot(10, lambda: self.setUpdatesEnabled(True))
 
+    def _refresh_visible_children(self) -> None:
+        """Display widgets only of labels in rows close to the viewport."""
+        spacing = self._grid.verticalSpacing()
+        row_height = self._label_style.icon_radius*2 + spacing
+        group_height = 2*row_height
+        group_size = 2*self._columns - 1
+
+        top = self._area.verticalScrollBar().value()
+        first_group = max(0, top//group_height - self.MARGIN_GROUPS)
+        last_group = (top+self._area.height())//group_height
+        end_group = last_group + self.MARGIN_GROUPS + 1
+        visible = self._shown_labels[
+            first_group*group_size:end_group*group_size]
+
+        self._release_children(visible)
+        children = [self._get_child(label) for label in visible]
+
+        margins = self._grid_margins
+        self._grid.setContentsMargins(
+            margins.left(),
+            margins.top() + first_group*group_height,
+            margins.right(),
+            margins.bottom())
         self._grid.replace(children)
-        QTimer.singleShot(10, lambda: self.setUpdatesEnabled(True))
+
+        full_groups, rest = divmod(len(self._shown_labels), group_size)
+        rows = 2*full_groups + (rest > 0) + (rest > self._columns)
+        self._internal.setMinimumHeight(
+            rows*row_height + margins.top() + margins.bottom())
+
+    def _release_children(self, kept_labels: list[LabelInterface]) -> None:
+        """Make widgets of labels other than kept ones available for reuse."""
+        kept = set(kept_labels)
+        for label in list(self._known_children):
+            if label not in kept:
+                child = self._known_children.pop(label)
+                self._unused_children.setdefault(type(child), []).append(child)
+
+    def _get_child(self, label: LabelInterface) -> LabelWidget[T]:
+        """Return widget of the label, recycling unused one if possible."""
+        if label in self._known_children:
+            return self._known_children[label]
+
+        unused = self._unused_children.get(dispatch_label_widget(label))
+        if unused:
+            child = unused.pop()
+            child.set_label(label)
+        else:
+            child = self._create_child(label)
+
+        self._mark_child(child)
+        self._known_children[label] = child
+        return child
+
+    def _mark_child(self, child: LabelWidget[T]) -> None:
+        """Disable the widget when its value is used, enable otherwise."""
+        used = child.label.value in self._used_values
+        child.enabled = not used
+        child.draggable = not used
 
     def _create_child(self, label: LabelInterface) -> LabelWidget[T]:
         """Create LabelWidget[LabelInterface] that represent the label."""
         child = dispatch_label_widget(label)(
             label=label,
             label_widget_style=self._label_style,
-            parent=self)
+            parent=self._internal)
         child.setFixedSize(child.icon_radius*2, child.icon_radius*2)
         child.draggable = True
         child.add_instruction(ChildInstruction(self._value_label))
-
-        self._known_children[label] = child
         return child
 
     def replace_handled_labels(self, labels: Sequence[LabelInterface]) -> None:
-        """Replace current list of widgets with new ones."""
-        self.setUpdatesEnabled(False)
-        self._children_list.clear()
+        """Replace current list of labels with new ones."""
+        self.cancel_loading()
+        self._search_index.replace(labels)
+        self.apply_search_bar_filter()
+        self.widgets_changed.emit()
+
+    def load_handled_values(
+        self,
+        values: Sequence[Any],
+        create_labels: Callable[[list], list[LabelInterface]],
+        prefetch: Prefetch = lambda values, on_finished: on_finished(),
+        cancel_prefetch: Callable[[], None] = lambda: None,
+    ) -> None:
+        """
+        Replace current widgets with ones of values, created in chunks.
+
+        create_labels   -- creates labels from the chunk of values,
+                           omitting the impossible ones
+        prefetch        -- starts preparing the chunk of values in
+                           background, and calls the passed callback in
+                           the main thread when the chunk is ready
+        cancel_prefetch -- stops preparing all prefetched chunks
+
+        A chunk is created only after its prefetch is finished. Prefetch
+        of the next chunk is started right before creating the current
+        one, so that both happen at the same time.
+        """
+        self.cancel_loading()
+        self._search_index.replace([])
+        self.apply_search_bar_filter()
+
+        self._pending_values.extend(values)
+        self._create_labels = create_labels
+        self._prefetch = prefetch
+        self._cancel_prefetch = cancel_prefetch
+
+        if self._pending_values:
+            self._value_label.setText("Loading...")
+            self._prefetch_next_chunk()
+        self.widgets_changed.emit()
+
+    def cancel_loading(self) -> None:
+        """Stop creating widgets of values given to load_handled_values."""
+        self._load_id += 1
+        if not self._prefetched_chunks:
+            return
+        self._pending_values.clear()
+        self._prefetched_chunks.clear()
+        self._cancel_prefetch()
+        self._value_label.setText("")
 
-        for label in labels:
-            if label in self._known_children:
-                self._children_list.append(self._known_children[label])
-            else:
-                self._children_list.append(self._create_child(label))
+    def _prefetch_next_chunk(self) -> None:
+        """Start preparing the next chunk of values to load."""
+        chunk = [self._pending_values.popleft() for _ in range(
+            min(self.LOAD_CHUNK_SIZE, len(self._pending_values)))]
+        self._prefetched_chunks.append(chunk)
 
-        self._grid.extend(self._children_list)
-        QTimer.singleShot(10, lambda: self.setUpdatesEnabled(True))
+        load_id = self._load_id
+
+        def on_finished() -> None:
+            # Delay, as prefetch may report being finished right away
+            QTimer.singleShot(0, lambda: self._load_next_chunk(load_id))
+        self._prefetch(chunk, on_finished)
+
+    def _load_next_chunk(self, load_id: int) -> None:
+        """Create widgets of the prefetched chunk and display them."""
+        if load_id != self._load_id or not self._prefetched_chunks:
+            return
+
+        chunk = self._prefetched_chunks.popleft()
+        if self._pending_values:
+            self._prefetch_next_chunk()
+        labels = self._create_labels(chunk)
+
+        if not self._prefetched_chunks:
+            self._cancel_prefetch()
+            self._value_label.setText("")
+
+        self._search_index.extend(labels)
+        self.apply_search_bar_filter()
         self.widgets_changed.emit()
 
     def mark_used_values(self, used_values: list) -> None:
         """Make all values currently used in pie non draggable and disabled."""
-        for widget in self._children_list:
-            if widget.label.value in used_values:
-                widget.enabled = False
-                widget.draggable = False
-            else:
-                widget.enabled = True
-                widget.draggable = True
+        used = {v for v in used_values if isinstance(v, Hashable)}
+        flipped = used ^ self._used_values
+        self._used_values = used
+        if not flipped:
+            return
+
+        # Updates may be already disabled by pending filtering, which
+        # enables them on its own
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        for label, child in self._known_children.items():
+            if label.value in flipped:
+                self._mark_child(child)
+        if updates_enabled:
+            self.setUpdatesEnabled(True)
 
     def leaveEvent(self, e: QEvent) -> None:
         """Notice that mouse moved out of the widget."""
         super().leaveEvent(e)
-        self._value_label.setText("")
+        loading = bool(self._prefetched_chunks)
+        self._value_label.setText("Loading..." if loading else "")
 
 
 class ChildInstruction(WidgetInstructions):
@@ -2,5 +2,6 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from .offset_grid_layout import OffsetGridLayout
+from .search_index import SearchIndex
 
-__all__ = ["OffsetGridLayout"]
+__all__ = ["OffsetGridLayout", "SearchIndex"]
@@ -24,6 +24,9 @@ class OffsetGridLayout(QGridLayout):
     The layout acts like list of widgets it's responsibility is to
     automatically refresh, when changes are being made to it.
 
+    Grid positions of held widgets are remembered, so that refreshing
+    moves only the widgets which position changed.
+
     Implemented using QGridLayout in which every widget uses 2x2 fields.
 
     max_columns -- Amount of widgets in uneven rows.
@@ -35,6 +38,7 @@ class OffsetGridLayout(QGridLayout):
     def __init__(self, max_columns: int, owner: QWidget) -> None:
         super().__init__()
         self._widgets: list[LabelWidget] = []
+        self._positions: dict[LabelWidget, GridPosition] = {}
         self._max_columns = max_columns
         self._items_in_group = 2*max_columns - 1
         self._owner = owner
@@ -60,11 +64,16 @@ class OffsetGridLayout(QGridLayout):
     def _internal_insert(self, index: int, widget: LabelWidget
                          ) -> None:
         """Insert widget at given index if not stored already."""
-        if widget in self._widgets:
+        if widget in self._positions:
             return
+        self._adopt(widget)
+        self._widgets.insert(index, widget)
+
+    def _adopt(self, widget: LabelWidget) -> None:
+        """Show the widget in owner, at position yet to be established."""
         widget.setParent(self._owner)
         widget.show()
-        self._widgets.insert(index, widget)
+        self._positions[widget] = GridPosition(-1, -1)
 
     def insert(self, index: int, widget: LabelWidget) -> None:
         """Insert the widget at given index and refresh the layout."""
@@ -84,20 +93,25 @@ class OffsetGridLayout(QGridLayout):
 
     def replace(self, widgets: list[LabelWidget]) -> None:
         """Replace all existing widgets with the ones provided."""
-        if widgets == self._widgets:
-            return
-
-        for kept_widget in self._widgets:
-            if kept_widget not in widgets:
-                kept_widget.hide()
-                self.removeWidget(kept_widget)
-                kept_widget.setParent(None)  # type: ignore
-
-        self._widgets.clear()
-        self.extend(widgets)
+        new_widgets = set(widgets)
+        for old_widget in self._widgets:
+            if old_widget not in new_widgets:
+                old_widget.hide()
+                self.removeWidget(old_widget)
+                old_widget.setParent(None)  # type: ignore
+                del self._positions[old_widget]
+
+        self._widgets = list(dict.fromkeys(widgets))
+        for widget in self._widgets:
+            if widget not in self._positions:
+                self._adopt(widget)
         self._refresh()
 
     def _refresh(self) -> None:
-        """Refresh the layout by adding all the internal widgets to it."""
+        """Refresh the layout by moving widgets which position changed."""
         for i, widget in enumerate(self._widgets):
-            self.addWidget(widget, *self._get_position(i), 2, 2)
+            position = self._get_position(i)
+            if self._positions[widget] != position:
+                self.removeWidget(widget)
+                self.addWidget(widget, *position, 2, 2)
+                self._positions[widget] = position
@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Iterable, Sequence
+
+from ...label_interface import LabelInterface
+
+
+class SearchIndex:
+    """
+    Finds labels which pretty names contain a phrase, ignoring the case.
+
+    Lowercase names are computed once, when labels are added. Each
+    trigram (three consecutive letters) of the names is mapped to the
+    set of label indices which contain it. Labels matching the phrase
+    are then looked for only among those sharing all its trigrams.
+
+    Result of the last search is remembered. When the next phrase
+    contains the previous one, as it happens when typing, only the
+    previous results are checked.
+    """
+
+    def __init__(self) -> None:
+        self._labels: list[LabelInterface] = []
+        self._names: list[str] = []
+        self._trigrams: dict[str, set[int]] = {}
+        self._last_phrase: str | None = None
+        self._last_result: list[int] = []
+
+    def __len__(self) -> int:
+        """Amount of indexed labels."""
+        return len(self._labels)
+
+    def replace(self, labels: Iterable[LabelInterface]) -> None:
+        """Replace indexed labels with new ones."""
+        self._labels.clear()
+        self._names.clear()
+        self._trigrams.clear()
+        self.extend(labels)
+
+    def extend(self, labels: Iterable[LabelInterface]) -> None:
+        """Add labels at the end of the index."""
+        for label in labels:
+            index = len(self._labels)
+            name = label.pretty_name.lower()
+            self._labels.append(label)
+            self._names.append(name)
+            for trigram in self._split_to_trigrams(name):
+                self._trigrams.setdefault(trigram, set()).add(index)
+        self._last_phrase = None
+
+    def search(self, phrase: str) -> list[LabelInterface]:
+        """Return labels which names contain the phrase, in their order."""
+        phrase = phrase.lower()
+        if not phrase:
+            return list(self._labels)
+
+        result = [i for i in self._candidates(phrase)
+                  if phrase in self._names[i]]
+
+        self._last_phrase = phrase
+        self._last_result = result
+        return [self._labels[i] for i in result]
+
+    def _candidates(self, phrase: str) -> Sequence[int]:
+        """Return indices of labels which may contain the phrase."""
+        if self._last_phrase is not None and self._last_phrase in phrase:
+            return self._last_result
+
+        trigrams = self._split_to_trigrams(phrase)
+        if not trigrams:
+            return range(len(self._labels))
+
+        postings = sorted(
+            (self._trigrams.get(trigram, set()) for trigram in trigrams),
+            key=len)
+        return sorted(postings[0].intersection(*postings[1:]))
+
+    @staticmethod
+    def _split_to_trigrams(text: str) -> set[str]:
+        """Return all sequences of three consecutive letters in text."""
+        return {text[i:i+3] for i in range(len(text)-2)}
@@ -20,6 +20,8 @@ class LabelInterface(Protocol, Generic[T]):
     - `pretty_name` -- String to use when displaying the label to user
     """
 
+    __slots__ = ()
+
     value: T
     display_value: QPixmap | QIcon | LabelText | QColor | None
     pretty_name: str
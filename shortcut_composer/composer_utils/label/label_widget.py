@@ -7,7 +7,6 @@ from PyQt.QtCore import Qt, QMimeData, QEvent
 from PyQt.QtWidgets import QWidget
 from PyQt.QtGui import QDrag, QPixmap, QMouseEvent, QPaintEvent
 
-from api_krita import Krita
 from api_krita.pyqt import Painter, PixmapTransform, BaseWidget
 from .label_widget_style import LabelWidgetStyle
 from .label_interface import LabelInterface
@@ -49,6 +48,21 @@ class LabelWidget(BaseWidget, Generic[T]):
 
         self._instructions: list[WidgetInstructions] = []
 
+    def set_label(self, label: T) -> None:
+        """
+        Display another label of the same display type in the widget.
+
+        Hover and forced states belonged to the previous label, so they
+        are cleared.
+        """
+        if self._hovered:
+            for instruction in self._instructions:
+                instruction.on_leave(self.label)
+        self._hovered = False
+        self._forced = False
+        self.label = label
+        self.update()
+
     def add_instruction(self, instruction: WidgetInstructions):
         """Add additional logic to do on entering and leaving widget."""
         self._instructions.append(instruction)
@@ -63,37 +77,40 @@ class LabelWidget(BaseWidget, Generic[T]):
 
         Paint a background behind a label its border, and image itself.
         """
+        style = self._label_widget_style.snapshot
+        indicator_thickness = style.border_thickness*2
+
         # label background
         painter.paint_wheel(
             center=self.center,
             outer_radius=(
-                self.icon_radius
-                - self._active_indicator_thickness
-                - self._label_widget_style.border_thickness//2),
-            color=Krita.get_main_color_from_theme())
+                style.icon_radius
+                - indicator_thickness
+                - style.border_thickness//2),
+            color=style.theme_color)
 
         # label thin border
         painter.paint_wheel(
             center=self.center,
-            outer_radius=self.icon_radius-self._active_indicator_thickness,
-            color=self._label_widget_style.border_color,
-            thickness=self._label_widget_style.border_thickness)
+            outer_radius=style.icon_radius-indicator_thickness,
+            color=style.border_color,
+            thickness=style.border_thickness)
 
         # label thick border when label when disabled
         if not self.enabled:
             painter.paint_wheel(
                 center=self.center,
-                outer_radius=self.icon_radius,
-                color=self._label_widget_style.active_color_dark,
-                thickness=self._active_indicator_thickness)
+                outer_radius=style.icon_radius,
+                color=style.active_color_dark,
+                thickness=indicator_thickness)
 
         # label thick border when hovered (or it is forced)
         if self.forced or (self._hovered and self.draggable):
             painter.paint_wheel(
                 center=self.center,
-                outer_radius=self.icon_radius,
-                color=self._label_widget_style.active_color,
-                thickness=self._active_indicator_thickness)
+                outer_radius=style.icon_radius,
+                color=style.active_color,
+                thickness=indicator_thickness)
 
     @property
     def _active_indicator_thickness(self) -> int:
@@ -8,6 +8,7 @@ from PyQt.QtCore import Qt
 from PyQt.QtGui import QIcon
 from PyQt.QtWidgets import QWidget, QLabel
 
+from api_krita.pyqt import PixmapCache
 from ..label_widget_style import LabelWidgetStyle
 from ..label_widget import LabelWidget
 from ..label_interface import LabelInterface
@@ -27,6 +28,13 @@ class IconLabelWidget(LabelWidget[T]):
         super().__init__(label, label_widget_style, parent)
         self._pyqt_label = self._create_pyqt_label()
 
+    def set_label(self, label: T) -> None:
+        """Display another label, replacing the Qt label which shows it."""
+        super().set_label(label)
+        self._pyqt_label.hide()
+        self._pyqt_label.deleteLater()
+        self._pyqt_label = self._create_pyqt_label()
+
     def _create_pyqt_label(self) -> QLabel:
         """Create and show a new Qt5 label. Does not need redrawing."""
         to_display = self.label.display_value
@@ -38,7 +46,9 @@ class IconLabelWidget(LabelWidget[T]):
 
         label = QLabel(self)
         label.setScaledContents(False)
-        label.setPixmap(to_display.pixmap(size, size))
+        label.setPixmap(PixmapCache.get(
+            key=(self.label.value, size, self.devicePixelRatioF(), "icon"),
+            create=lambda: to_display.pixmap(size, size)))
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         label.resize(size, size)
         label.move(self.center.x()-size//2, self.center.y()-size//2)
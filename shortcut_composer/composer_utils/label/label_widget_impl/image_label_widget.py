@@ -7,7 +7,7 @@ from PyQt.QtCore import Qt
 from PyQt.QtGui import QPixmap
 from PyQt.QtWidgets import QWidget, QLabel
 
-from api_krita.pyqt import PixmapTransform
+from api_krita.pyqt import PixmapTransform, PixmapCache
 from ..label_widget_style import LabelWidgetStyle
 from ..label_widget import LabelWidget
 from ..label_interface import LabelInterface
@@ -27,6 +27,13 @@ class ImageLabelWidget(LabelWidget[T]):
         super().__init__(label, label_widget_style, parent)
         self._pyqt_label = self._create_pyqt_label()
 
+    def set_label(self, label: T) -> None:
+        """Display another label, replacing the Qt label which shows it."""
+        super().set_label(label)
+        self._pyqt_label.hide()
+        self._pyqt_label.deleteLater()
+        self._pyqt_label = self._create_pyqt_label()
+
     def _create_pyqt_label(self) -> QLabel:
         """Create and show a new Qt5 label. Does not need redrawing."""
         to_display = self.label.display_value
@@ -39,9 +46,23 @@ class ImageLabelWidget(LabelWidget[T]):
             - self._label_widget_style.border_thickness
             - self._active_indicator_thickness)*2)
 
+        ratio = self.devicePixelRatioF()
+        pixel_size = round(size*ratio)
+
+        def create_pixmap() -> QPixmap:
+            pixmap = PixmapTransform.make_pixmap_round(to_display).scaled(
+                pixel_size,
+                pixel_size,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation)
+            pixmap.setDevicePixelRatio(ratio)
+            return pixmap
+
         label = QLabel(self)
-        label.setScaledContents(True)
-        label.setPixmap(PixmapTransform.make_pixmap_round(to_display))
+        label.setScaledContents(False)
+        label.setPixmap(PixmapCache.get(
+            key=(self.label.value, pixel_size, ratio, "round"),
+            create=create_pixmap))
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         label.resize(size, size)
         label.move(self.center.x()-size//2, self.center.y()-size//2)
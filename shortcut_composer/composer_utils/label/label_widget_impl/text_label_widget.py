@@ -27,6 +27,13 @@ class TextLabelWidget(LabelWidget[T]):
         super().__init__(label, label_widget_style, parent)
         self._pyqt_label = self._create_pyqt_label()
 
+    def set_label(self, label: T) -> None:
+        """Display another label, replacing the Qt label which shows it."""
+        super().set_label(label)
+        self._pyqt_label.hide()
+        self._pyqt_label.deleteLater()
+        self._pyqt_label = self._create_pyqt_label()
+
     def _create_pyqt_label(self) -> QLabel:
         """Create and show a new Qt5 label. Does not need redrawing."""
         to_display = self.label.display_value
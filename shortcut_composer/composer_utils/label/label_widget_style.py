@@ -2,7 +2,8 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import re
-from typing import Callable
+from dataclasses import dataclass
+from typing import Callable, Hashable
 
 from PyQt.QtGui import QFont, QColor, QFontDatabase
 
@@ -10,6 +11,23 @@ from api_krita import Krita
 from composer_utils import Config
 
 
+@dataclass(frozen=True)
+class LabelWidgetStyleSnapshot:
+    """Immutable values of LabelWidgetStyle compiled from its callbacks."""
+
+    icon_radius: int
+    border_thickness: int
+    active_color: QColor
+    background_color: QColor
+    active_color_dark: QColor
+    border_color: QColor
+    theme_color: QColor
+    max_lines_amount: int
+    max_signs_amount: int
+    abbreviation_sign: str
+    text_scale: float
+
+
 class LabelWidgetStyle:
     """
     Holds and calculates configuration of displayed elements.
@@ -17,6 +35,12 @@ class LabelWidgetStyle:
     Style elements are calculated based on passed callbacks.
     Can split given text based on limits imposed by those callbacks.
     Creates font object with correct size based on amount of text.
+
+    Values of callbacks are compiled into an immutable snapshot, which
+    is reused until the key returned by `snapshot_key_callback` or the
+    theme changes, or until `mark_outdated()` is called. Without the key
+    callback, callbacks are expected to return the same values as long
+    as the theme does not change, like the default ones do.
     """
 
     def __init__(
@@ -35,6 +59,7 @@ class LabelWidgetStyle:
         = lambda: 8,
         abbreviation_sign_callback: Callable[[], str]
         = lambda: ".",
+        snapshot_key_callback: Callable[[], Hashable] = lambda: None,
     ) -> None:
         self._icon_radius_callback = icon_radius_callback
         self._border_thickness_callback = border_thickness_callback
@@ -43,38 +68,75 @@ class LabelWidgetStyle:
         self._max_lines_amount_callback = max_lines_amount_callback
         self._max_signs_amount_callback = max_signs_amount_callback
         self._abbreviation_sign_callback = abbreviation_sign_callback
+        self._snapshot_key_callback = snapshot_key_callback
+
+        self._snapshot: LabelWidgetStyleSnapshot | None = None
+        self._snapshot_key: Hashable = None
+
+    @property
+    def snapshot(self) -> LabelWidgetStyleSnapshot:
+        """Return compiled values of the style, recompiled when outdated."""
+        key = (
+            Krita.palette_key,
+            Config.TEXT_LABEL_GLOBAL_SCALE.generation,
+            self._snapshot_key_callback())
+        if self._snapshot is None or key != self._snapshot_key:
+            self._snapshot = self._compile()
+            self._snapshot_key = key
+        return self._snapshot
+
+    def mark_outdated(self) -> None:
+        """Make the snapshot compile again on next access."""
+        self._snapshot = None
+
+    def _compile(self) -> LabelWidgetStyleSnapshot:
+        """Evaluate all the callbacks and derive the remaining values."""
+        active_color = self._active_color_callback()
+        background_color = self._background_color_callback()
+        return LabelWidgetStyleSnapshot(
+            icon_radius=self._icon_radius_callback(),
+            border_thickness=self._border_thickness_callback(),
+            active_color=active_color,
+            background_color=background_color,
+            active_color_dark=QColor(
+                round(active_color.red()*0.8),
+                round(active_color.green()*0.8),
+                round(active_color.blue()*0.8)),
+            border_color=QColor(
+                min(background_color.red()+15, 255),
+                min(background_color.green()+15, 255),
+                min(background_color.blue()+15, 255)),
+            theme_color=Krita.get_main_color_from_theme(),
+            max_lines_amount=self._max_lines_amount_callback(),
+            max_signs_amount=self._max_signs_amount_callback(),
+            abbreviation_sign=self._abbreviation_sign_callback(),
+            text_scale=Config.TEXT_LABEL_GLOBAL_SCALE.read())
 
     @property
     def icon_radius(self) -> int:
-        return self._icon_radius_callback()
+        return self.snapshot.icon_radius
 
     @property
     def border_thickness(self) -> int:
-        return self._border_thickness_callback()
+        return self.snapshot.border_thickness
 
     @property
     def active_color(self) -> QColor:
-        return self._active_color_callback()
+        return self.snapshot.active_color
 
     @property
     def background_color(self) -> QColor:
-        return self._background_color_callback()
+        return self.snapshot.background_color
 
     @property
     def active_color_dark(self) -> QColor:
         """Color variation of active element."""
-        return QColor(
-            round(self.active_color.red()*0.8),
-            round(self.active_color.green()*0.8),
-            round(self.active_color.blue()*0.8))
+        return self.snapshot.active_color_dark
 
     @property
     def border_color(self) -> QColor:
         """Color of icon borders."""
-        return QColor(
-            min(self.background_color.red()+15, 255),
-            min(self.background_color.green()+15, 255),
-            min(self.background_color.blue()+15, 255))
+        return self.snapshot.border_color
 
     def split_text_to_lines(self, text: str) -> list[str]:
         """
@@ -98,9 +160,10 @@ class LabelWidgetStyle:
         Input: 'This is inscription with text that is too long'
         Output ['This is', 'inscript.' 'with text.']
         """
-        MAX_LINES = self._max_lines_amount_callback()
-        MAX_SIGNS = self._max_signs_amount_callback()
-        ABBR_SIGN = self._abbreviation_sign_callback()
+        snapshot = self.snapshot
+        MAX_LINES = snapshot.max_lines_amount
+        MAX_SIGNS = snapshot.max_signs_amount
+        ABBR_SIGN = snapshot.abbreviation_sign
 
         if not text:
             return []
@@ -146,7 +209,7 @@ class LabelWidgetStyle:
         font.setPointSize(round(
             0.175
             * widget_width
-            * Config.TEXT_LABEL_GLOBAL_SCALE.read()
+            * self.snapshot.text_scale
             * self._content_size_multiplier(text_to_display)))
         font.setBold(True)
         return font
@@ -43,6 +43,23 @@ class SettingsDialog(QDialog):
                 tooltip=""
                 "Maximal amount of widget repaints in one second.\n"
                 "0 lifts the FPS limit."),
+            Checkbox(
+                config_field=Config.WARM_UP_ACTIONS,
+                parent=self,
+                pretty_name="Warm up actions",
+                tooltip=""
+                "Prepare action widgets in the background after startup,\n"
+                "so that their first use is not delayed.\n"
+                "Recently used actions are prepared first."),
+            Checkbox(
+                config_field=Config.PACK_DOCUMENT_SETTINGS,
+                parent=self,
+                pretty_name="Pack document settings",
+                tooltip=""
+                "Store settings of each pie in a single .kra annotation,\n"
+                "which makes loading documents faster.\n"
+                "Such documents can't be read by older plugin versions.\n"
+                "Takes effect after restarting Krita."),
 
             "Cursor trackers",
             SpinBox(
@@ -64,6 +81,15 @@ class SettingsDialog(QDialog):
                 "Amount of pixels that the cursor needs to be moved\n"
                 "for a tracker to snap to horizontal or vertical axis.\n\n"
                 "Applies only to trackers that operate in both axes"),
+            Checkbox(
+                config_field=Config.POLL_PIE_CURSOR,
+                parent=self,
+                pretty_name="Poll pie cursor",
+                tooltip=""
+                "Check the cursor position of an open pie in intervals\n"
+                "given by the FPS limit, instead of on cursor movement.\n\n"
+                "Use it when the pie does not follow the cursor moving\n"
+                "outside of krita windows."),
 
             "Pie menu size",
             SpinBox(
@@ -7,11 +7,15 @@ System granting easier API to control krita configuration in kritarc.
 Consists of two classes: "Field" and "FieldGroup".
 Read the documentation of those classes for more info.
 
+"CallbackScope" allows to unregister callbacks of a single owner at
+once, when the owner is no longer used.
+
 Holds a subpackage with ui elements dependent on the introduced
 configuration concept.
 """
 
 from .field import Field
 from .field_group import FieldGroup
+from .callback_scope import CallbackScope
 
-__all__ = ["Field", "FieldGroup"]
+__all__ = ["Field", "FieldGroup", "CallbackScope"]
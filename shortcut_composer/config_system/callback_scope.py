@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Callable, Protocol
+
+
+class SupportsCallbacks(Protocol):
+    """Object to which callbacks can be registered and unregistered."""
+
+    def register_callback(self, callback: Callable[[], None]) -> None: ...
+    def unregister_callback(self, callback: Callable[[], None]) -> None: ...
+
+
+class CallbackScope:
+    """
+    Callbacks registered on fields or groups in the name of one owner.
+
+    Fields can outlive objects which registered callbacks on them.
+    That is the case for fields of global configuration, which would
+    keep the owner alive forever, and run its callbacks long after it
+    stopped being used.
+
+    Registering callbacks through the scope, allows to unregister all
+    of them at once with `release()` when the owner is no longer used.
+    """
+
+    def __init__(self) -> None:
+        self._registered: list[
+            tuple[SupportsCallbacks, Callable[[], None]]] = []
+
+    def register(
+        self,
+        target: SupportsCallbacks,
+        callback: Callable[[], None]
+    ) -> None:
+        """Register callback on the target, and remember it."""
+        target.register_callback(callback)
+        self._registered.append((target, callback))
+
+    def release(self) -> None:
+        """Unregister all callbacks registered with this scope."""
+        for target, callback in self._registered:
+            target.unregister_callback(callback)
+        self._registered.clear()
@@ -4,6 +4,7 @@
 """Components used by the core of the config system."""
 
 from .api_krita import Krita
-from .save_location import SaveLocation
+from .save_location import SaveLocation, LocalSettings
+from .callback_dispatcher import Dispatcher
 
-__all__ = ["Krita", "SaveLocation"]
+__all__ = ["Krita", "SaveLocation", "LocalSettings", "Dispatcher"]
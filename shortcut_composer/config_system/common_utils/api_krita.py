@@ -3,7 +3,7 @@
 
 """Required part of api_krita package, so that no dependency is needed."""
 
-from typing import Any, Protocol
+from typing import Any, Callable, Protocol
 from dataclasses import dataclass
 
 from krita import Krita as Api
@@ -43,6 +43,14 @@ class KritaInstance:
             return None
         return Document(document)
 
+    def add_document_saved_callback(self, callback: Callable[[], None]):
+        """Run callback each time any document is saved."""
+        self.instance.notifier().imageSaved.connect(lambda _: callback())
+
+    def add_application_closing_callback(self, callback: Callable[[], None]):
+        """Run callback when krita is about to close."""
+        self.instance.notifier().applicationClosing.connect(callback)
+
 
 class KritaDocument(Protocol):
     """Krita `Document` object API."""
@@ -54,6 +62,7 @@ class KritaDocument(Protocol):
         annotation: bytes) -> None: ...
 
     def annotation(self, type: str) -> QByteArray: ...
+    def removeAnnotation(self, type: str) -> None: ...
     def annotationTypes(self) -> list[str]: ...
 
 
@@ -74,9 +83,17 @@ class Document:
             description,
             value.encode(encoding="utf-8"))
 
+    def remove_annotation(self, name: str) -> None:
+        """Remove annotation from .kra document."""
+        self.document.removeAnnotation(name)
+
     def contains_annotation(self, name: str) -> bool:
         """Return if annotation of given name is stored in .kra."""
         return name in self.document.annotationTypes()
 
+    def get_annotation_names(self) -> set[str]:
+        """Return names of all annotations stored in .kra."""
+        return set(self.document.annotationTypes())
+
 
 Krita = KritaInstance()
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Callable, Iterable, Iterator
+from contextlib import contextmanager
+
+
+class CallbackDispatcher:
+    """
+    Runs callbacks of fields which values changed.
+
+    Outside of transaction, callbacks are run right away. Inside it,
+    they are remembered and run once the outermost transaction ends.
+    Each callback is run at most once per transaction, even when
+    multiple written fields registered it.
+
+    Dispatcher is shared by all fields, as callbacks are often
+    registered on fields from different groups.
+    """
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._pending: dict[Callable[[], None], None] = {}
+
+    def dispatch(self, callbacks: Iterable[Callable[[], None]]) -> None:
+        """Run callbacks now, or postpone them when in transaction."""
+        if not self._depth:
+            for callback in callbacks:
+                callback()
+            return
+
+        for callback in callbacks:
+            self._pending[callback] = None
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Postpone running callbacks until the end of the context."""
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self._flush()
+
+    def _flush(self) -> None:
+        """Run pending callbacks in order in which they were scheduled."""
+        pending = list(self._pending)
+        self._pending.clear()
+        for callback in pending:
+            callback()
+
+
+Dispatcher = CallbackDispatcher()
@@ -1,10 +1,12 @@
 # SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import json
 from typing import Any, Protocol
 from enum import Enum
 
-from .api_krita import Krita
+from .api_krita import Krita, Document
+from .write_behind import WriteBehind
 
 
 class SupportsReadWrite(Protocol):
@@ -12,51 +14,277 @@ class SupportsReadWrite(Protocol):
 
     def write(self, group: str, name: str, value: Any) -> None: ...
     def read(self, group: str, name: str, default: str) -> str | None: ...
+    def invalidate_cache(self) -> None: ...
+    def flush(self) -> None: ...
+    def generation(self, group: str, name: str) -> int: ...
 
 
 class GlobalSettings(SupportsReadWrite):
-    """Gives read/write interface for kritarc file."""
+    """
+    Gives read/write interface for kritarc file.
 
-    @staticmethod
-    def write(group: str, name: str, value: Any) -> None:
-        """Write value to kritarc."""
-        Krita.write_setting(group=group, name=name, value=value)
+    Values are cached in memory after first read, and updated on each
+    write, so that kritarc is accessed only once per setting. Cache is
+    shared between all fields, as multiple fields can represent the
+    same setting.
 
-    @staticmethod
+    Writing to kritarc is postponed until no value was written for a
+    while, or until krita is about to close.
+    """
+
+    _cache: dict[tuple[str, str], str | None] = {}
+    _writes = WriteBehind(delay_ms=500)
+    _generations: dict[tuple[str, str], int] = {}
+    _cache_generation = 0
+
+    @classmethod
+    def write(cls, group: str, name: str, value: Any) -> None:
+        """Remember value in cache and schedule writing it to kritarc."""
+        def write_to_kritarc() -> None:
+            Krita.write_setting(group=group, name=name, value=value)
+
+        key = (group, name)
+        cls._cache[key] = str(value)
+        cls._generations[key] = cls._generations.get(key, 0) + 1
+        cls._writes.schedule(key, write_to_kritarc)
+
+    @classmethod
     def read(
+        cls,
         group: str,
         name: str,
         default: str = "Not stored"
     ) -> str | None:
-        """Write value from kritarc."""
-        return Krita.read_setting(group=group, name=name, default=default)
+        """Read value from cache, or from kritarc if it was not cached."""
+        key = (group, name)
+        if key not in cls._cache:
+            cls._cache[key] = Krita.read_setting(group=group, name=name)
 
+        red_value = cls._cache[key]
+        if red_value is None and default != "Not stored":
+            return default
+        return red_value
 
-class LocalSettings(SupportsReadWrite):
-    """Gives read/write interface to .kra document annotations. """
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Forget cached values, so that they are read from kritarc again."""
+        cls._writes.flush()
+        cls._cache.clear()
+        cls._cache_generation += 1
+
+    @classmethod
+    def generation(cls, group: str, name: str) -> int:
+        """Return number increased each time the value could change."""
+        return cls._cache_generation + cls._generations.get((group, name), 0)
+
+    @classmethod
+    def flush(cls) -> None:
+        """Write all pending values to kritarc right away."""
+        cls._writes.flush()
+
+
+class AnnotationIndex:
+    """
+    Annotations of a single .kra document kept in memory.
+
+    Names of all annotations are fetched once on initialization, and
+    each annotation is decoded only on its first read. Writes update
+    both the document and the index.
+
+    Values of packed groups are stored together in a single annotation
+    as versioned json. Values missing in the pack are migrated from
+    legacy annotations (one per field), and saved in the pack on next
+    write to this group. Migrated legacy annotations are removed when
+    the pack gets saved, so that they can't get out of sync with it.
+
+    Writing to the document is performed with passed WriteBehind.
+    """
+
+    PACK_VERSION = 1
+
+    def __init__(self, document: Document, writes: WriteBehind) -> None:
+        self.document = document
+        self._writes = writes
+        self._names = document.get_annotation_names()
+        self._values: dict[str, str] = {}
+        self._packs: dict[str, dict[str, str]] = {}
+        self._migrated: dict[str, set[str]] = {}
+
+    def read(self, name: str) -> str | None:
+        """Return annotation value or None if it is not in document."""
+        if name not in self._names:
+            return None
+        if name not in self._values:
+            self._values[name] = self.document.read_annotation(name)
+        return self._values[name]
+
+    def write(self, name: str, value: str) -> None:
+        """Remember annotation value and schedule writing it to document."""
+        def write_to_document() -> None:
+            self.document.write_annotation(name, "", value)
+
+        self._writes.schedule((self, name), write_to_document)
+        self._names.add(name)
+        self._values[name] = value
+
+    def remove(self, name: str) -> None:
+        """Forget annotation and schedule removing it from document."""
+        def remove_from_document() -> None:
+            self.document.remove_annotation(name)
+
+        self._writes.schedule((self, name), remove_from_document)
+        self._names.discard(name)
+        self._values.pop(name, None)
+
+    def read_unpacked(self, group: str, name: str) -> str | None:
+        """Return value from its own annotation, or from the group pack."""
+        value = self.read(f"{group} {name}")
+        if value is None:
+            return self._get_pack(group).get(name)
+        return value
+
+    def read_packed(self, group: str, name: str) -> str | None:
+        """Return value from the group pack or None if it is not there."""
+        pack = self._get_pack(group)
+        if name not in pack:
+            legacy_value = self.read(f"{group} {name}")
+            if legacy_value is None:
+                return None
+            pack[name] = legacy_value
+            self._migrated.setdefault(group, set()).add(name)
+        return pack[name]
+
+    def write_packed(self, group: str, name: str, value: str) -> None:
+        """Write value to the group pack, and save the pack to document."""
+        pack = self._get_pack(group)
+        pack[name] = value
+        self.write(
+            name=self._pack_name(group),
+            value=json.dumps({"version": self.PACK_VERSION, "values": pack}))
+
+        for legacy_name in self._migrated.pop(group, set()) | {name}:
+            if f"{group} {legacy_name}" in self._names:
+                self.remove(f"{group} {legacy_name}")
+
+    def _get_pack(self, group: str) -> dict[str, str]:
+        """Return values of packed group, parsing them on first access."""
+        if group not in self._packs:
+            self._packs[group] = self._parse_pack(group)
+        return self._packs[group]
+
+    def _parse_pack(self, group: str) -> dict[str, str]:
+        """Parse pack of group. Missing or invalid pack is empty."""
+        raw = self.read(self._pack_name(group))
+        if raw is None:
+            return {}
+        try:
+            pack = json.loads(raw)
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(pack, dict):
+            return {}
+        if pack.get("version") != self.PACK_VERSION:
+            return {}
+        try:
+            values = dict(pack.get("values", {}))
+        except (TypeError, ValueError):
+            return {}
+        return {str(name): str(value) for name, value in values.items()}
 
     @staticmethod
-    def write(group: str, name: str, value: Any) -> None:
+    def _pack_name(group: str) -> str:
+        """Return name of annotation storing pack of the group."""
+        return f"{group} #packed"
+
+
+class LocalSettings(SupportsReadWrite):
+    """
+    Gives read/write interface to .kra document annotations.
+
+    Annotations of active document are indexed in memory. Index is
+    rebuilt when active document changes, or any document is saved.
+
+    By default, each value is stored in its own annotation. Groups
+    marked with `pack_group()` store all their values in one.
+    Values of groups which are no longer packed are still read from
+    their pack, until they get written to their own annotations.
+
+    Writing to the document is postponed until control returns to the
+    event loop, so that multiple writes are performed together. Delay
+    is not longer, as the document could be saved at any moment.
+    """
+
+    _index: AnnotationIndex | None = None
+    _packed_groups: set[str] = set()
+    _writes = WriteBehind(delay_ms=0)
+    _generations: dict[tuple[str, str], int] = {}
+    _index_generation = 0
+
+    @classmethod
+    def pack_group(cls, group: str) -> None:
+        """Store all values of the group in a single annotation."""
+        cls._packed_groups.add(group)
+
+    @classmethod
+    def write(cls, group: str, name: str, value: Any) -> None:
         """Write value to .kra document as its annotation."""
-        document = Krita.get_active_document()
-        if document is not None:
-            document.write_annotation(f"{group} {name}", "",  str(value))
+        index = cls._get_index()
+        if index is None:
+            return
+        key = (group, name)
+        cls._generations[key] = cls._generations.get(key, 0) + 1
+        if group in cls._packed_groups:
+            index.write_packed(group, name, str(value))
+        else:
+            index.write(f"{group} {name}", str(value))
 
-    @staticmethod
+    @classmethod
     def read(
+        cls,
         group: str,
         name: str,
         default: str = "Not stored"
     ) -> str | None:
         """Read value from .kra document stored in its annotation."""
-        document = Krita.get_active_document()
-        annotation_name = f"{group} {name}"
+        index = cls._get_index()
+        if index is None:
+            red_value = None
+        elif group in cls._packed_groups:
+            red_value = index.read_packed(group, name)
+        else:
+            red_value = index.read_unpacked(group, name)
+
+        if red_value is None and default != "Not stored":
+            return default
+        return red_value
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Forget the index, so that it is rebuilt on next access."""
+        cls._writes.flush()
+        cls._index = None
+
+    @classmethod
+    def generation(cls, group: str, name: str) -> int:
+        """Return number increased each time the value could change."""
+        cls._get_index()
+        return cls._index_generation + cls._generations.get((group, name), 0)
 
-        if (document is None
-                or not document.contains_annotation(annotation_name)):
-            return None if default == "Not stored" else default
+    @classmethod
+    def flush(cls) -> None:
+        """Write all pending values to their documents right away."""
+        cls._writes.flush()
 
-        return document.read_annotation(annotation_name)
+    @classmethod
+    def _get_index(cls) -> AnnotationIndex | None:
+        """Return index of active document, rebuilding it if needed."""
+        document = Krita.get_active_document()
+        if document is None:
+            return None
+        if cls._index is None or cls._index.document != document:
+            cls._index = AnnotationIndex(document, cls._writes)
+            cls._index_generation += 1
+        return cls._index
 
 
 class SaveLocation(Enum):
@@ -78,7 +306,24 @@ class SaveLocation(Enum):
         """Read value from picked location."""
         return self.value.read(group, name, default)
 
+    def invalidate_cache(self) -> None:
+        """Make picked location forget values it cached."""
+        self.value.invalidate_cache()
+
+    def flush(self) -> None:
+        """Make picked location write its pending values right away."""
+        self.value.flush()
+
+    def generation(self, group: str, name: str) -> int:
+        """Return number increased each time the value could change."""
+        return self.value.generation(group, name)
+
     @property
     def value(self) -> SupportsReadWrite:
         """Enum holds values of type which support ReadWrite interface."""
         return super().value
+
+
+Krita.add_document_saved_callback(LocalSettings.invalidate_cache)
+Krita.add_application_closing_callback(GlobalSettings.flush)
+Krita.add_application_closing_callback(LocalSettings.flush)
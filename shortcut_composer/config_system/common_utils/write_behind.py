@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Callable, Hashable
+
+from PyQt.QtCore import QTimer
+
+
+class WriteBehind:
+    """
+    Postpones write operations, to perform them together later.
+
+    Scheduled writes are performed when no new write was scheduled for
+    `delay_ms`, or when `flush()` is called. Only the last write
+    scheduled with a given key is performed.
+    """
+
+    def __init__(self, delay_ms: int) -> None:
+        self._delay_ms = delay_ms
+        self._pending: dict[Hashable, Callable[[], None]] = {}
+        self._timer: QTimer | None = None
+
+    def schedule(self, key: Hashable, write: Callable[[], None]) -> None:
+        """Remember the write operation, and restart the timer."""
+        self._pending[key] = write
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self.flush)
+        self._timer.start(self._delay_ms)
+
+    def flush(self) -> None:
+        """Perform all pending write operations right away."""
+        if self._timer is not None:
+            self._timer.stop()
+        pending = list(self._pending.values())
+        self._pending.clear()
+        for write in pending:
+            write()
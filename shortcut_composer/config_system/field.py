@@ -34,6 +34,13 @@ class Field(Generic[T]):
     its location. Repeated saves of the same value are filtered, so that
     callbacks are not called when the same value is written multiple
     times one after the other.
+
+    Red values are cached, so that reading the same field repeatedly
+    does not require accessing and parsing the configuration each time.
+
+    Each field exposes a `generation` number, which grows each time the
+    field value could have changed. Objects that derive data from the
+    field can compare it to skip recomputing it.
     """
 
     def __new__(
@@ -69,6 +76,18 @@ class Field(Generic[T]):
     def register_callback(self, callback: Callable[[], None]) -> None:
         """Register a method which will be called when field value changes."""
 
+    def unregister_callback(self, callback: Callable[[], None]) -> None:
+        """Stop calling a method, which was registered before."""
+
     def reset_default(self) -> None:
         """Write a default value to kritarc file."""
         ...
+
+    def invalidate_cache(self) -> None:
+        """Force reading value from kritarc on next read."""
+        ...
+
+    @property
+    def generation(self) -> int:
+        """Return number increased each time the value could change."""
+        ...
@@ -5,7 +5,7 @@ from typing import TypeVar, Generic, Callable
 from abc import ABC, abstractmethod
 from enum import Enum
 
-from .common_utils import SaveLocation
+from .common_utils import SaveLocation, Dispatcher
 from .field import Field
 
 T = TypeVar('T')
@@ -35,11 +35,18 @@ class FieldBase(ABC, Field, Generic[T]):
         self.parser_type = parser_type
         self.location = SaveLocation.LOCAL if local else SaveLocation.GLOBAL
         self._on_change_callbacks: list[Callable[[], None]] = []
+        self._cached_raw: str | None = None
+        self._cached_value: T
 
     def register_callback(self, callback: Callable[[], None]) -> None:
         """Store callback in internal list."""
         self._on_change_callbacks.append(callback)
 
+    def unregister_callback(self, callback: Callable[[], None]) -> None:
+        """Remove callback from internal list if it is present."""
+        if callback in self._on_change_callbacks:
+            self._on_change_callbacks.remove(callback)
+
     def write(self, value: T) -> None:
         """Write value to file and run callbacks if it was not redundant."""
         if not isinstance(value, type(self.default)):
@@ -48,16 +55,49 @@ class FieldBase(ABC, Field, Generic[T]):
         if self._is_write_redundant(value):
             return
 
+        raw = self._to_string(value)
         self.location.write(
             group=self.config_group,
             name=self.name,
-            value=self._to_string(value))
-        for callback in self._on_change_callbacks:
-            callback()
+            value=raw)
+        self._cached_raw = raw
+        self._cached_value = self._copy(value)
+        Dispatcher.dispatch(self._on_change_callbacks)
 
-    @abstractmethod
     def read(self) -> T:
-        """Return value from kritarc parsed to field type."""
+        """
+        Return value from kritarc parsed to field type.
+
+        Parsed value is cached, and parsing is repeated only when the
+        string stored in save location is different from the cached one.
+        """
+        raw = self.location.read(self.config_group, self.name)
+        if raw is None:
+            return self._copy(self.default)
+
+        if raw != self._cached_raw:
+            self._cached_value = self._parse(raw)
+            self._cached_raw = raw
+        return self._copy(self._cached_value)
+
+    @property
+    def generation(self) -> int:
+        """Return number increased each time the value could change."""
+        return self.location.generation(self.config_group, self.name)
+
+    def invalidate_cache(self) -> None:
+        """Forget cached value, so that it is parsed again on next read."""
+        self._cached_raw = None
+        self.location.invalidate_cache()
+
+    @abstractmethod
+    def _parse(self, raw: str) -> T:
+        """Convert a string from save location to field type."""
+        ...
+
+    @abstractmethod
+    def _copy(self, value: T) -> T:
+        """Return copy of the value, so that cached one can't be modified."""
         ...
 
     @abstractmethod
@@ -38,6 +38,10 @@ class Parser(Generic[T], Protocol):
         """Parse from specific type to string."""
         ...
 
+    def copy(self, value: T) -> T:
+        """Return a copy of value, which is safe to be modified."""
+        return value
+
 
 class BasicParser(Parser[Basic]):
     """Parses from string to basic type and vice-versa."""
@@ -98,3 +102,7 @@ class ColorParser(Parser[QColor]):
     def parse_from(self, value: QColor) -> str:
         """Parses from QColor to string."""
         return f"{value.red()},{value.green()},{value.blue()},{value.alpha()}"
+
+    def copy(self, value: QColor) -> QColor:
+        """Return a new QColor, as QColor objects are mutable."""
+        return QColor(value)
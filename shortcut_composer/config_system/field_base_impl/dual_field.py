@@ -3,6 +3,7 @@
 
 from typing import Callable, Generic, TypeVar
 
+from ..common_utils import Dispatcher
 from ..field import Field
 from ..field_group import FieldGroup
 
@@ -55,9 +56,10 @@ class DualField(Field, Generic[T]):
         Write to correct internal fields, based on determiner.
         Global field must always be written to activate callbacks.
         """
-        if self._is_local_determiner.read():
-            self._loc.write(value)
-        self._glob.write(value)
+        with Dispatcher.transaction():
+            if self._is_local_determiner.read():
+                self._loc.write(value)
+            self._glob.write(value)
 
     def read(self) -> T:
         """Read from local or global field, based on determiner."""
@@ -69,10 +71,27 @@ class DualField(Field, Generic[T]):
         """Subscribe callback to both fields, as only one changes on write."""
         self._glob.register_callback(callback)
 
+    def unregister_callback(self, callback: Callable[[], None]) -> None:
+        """Unsubscribe callback from global field, which stores them."""
+        self._glob.unregister_callback(callback)
+
     def reset_default(self) -> None:
         """Reset both fields to default."""
-        self._loc.reset_default()
-        self._glob.reset_default()
+        with Dispatcher.transaction():
+            self._loc.reset_default()
+            self._glob.reset_default()
+
+    @property
+    def generation(self) -> int:
+        """Sum of generations, as value depends on all three fields."""
+        return (self._is_local_determiner.generation
+                + self._loc.generation
+                + self._glob.generation)
+
+    def invalidate_cache(self) -> None:
+        """Invalidate cache of both fields."""
+        self._loc.invalidate_cache()
+        self._glob.invalidate_cache()
 
     def refresh(self) -> None:
         """
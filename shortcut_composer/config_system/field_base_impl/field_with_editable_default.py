@@ -45,5 +45,15 @@ class FieldWithEditableDefault(Field, Generic[T, F]):
     def register_callback(self, callback: Callable[[], None]) -> None:
         self.field.register_callback(callback)
 
+    def unregister_callback(self, callback: Callable[[], None]) -> None:
+        self.field.unregister_callback(callback)
+
     def reset_default(self) -> None:
         self.field.reset_default()
+
+    @property
+    def generation(self) -> int:
+        return self.field.generation + self._default_field.generation
+
+    def invalidate_cache(self) -> None:
+        self.field.invalidate_cache()
@@ -42,22 +42,22 @@ class ListField(FieldBase, Generic[T]):
             return passed_type
         return type(self.default[0])
 
-    def read(self) -> list[T]:
+    def _parse(self, raw: str) -> list[T]:
         """
-        Return value from kritarc parsed to field type.
+        Parse the string from save location to list of values.
 
         Each list element requires parsing.
         """
-        raw = self.location.read(self.config_group, self.name)
-        if raw is None:
-            return self.default.copy()
-
         if raw == "":
             return []
 
         values_list = raw.split("\t")
         return [self._parser.parse_to(value) for value in values_list]
 
+    def _copy(self, value: list[T]) -> list[T]:
+        """Copy the list along with each of its elements."""
+        return [self._parser.copy(element) for element in value]
+
     def _to_string(self, value: list[T]) -> str:
         """Convert list of values to string by parsing each element alone."""
         return "\t".join([self._parser.parse_from(item) for item in value])
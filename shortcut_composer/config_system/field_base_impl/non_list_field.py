@@ -23,13 +23,14 @@ class NonListField(FieldBase, Generic[T]):
         super().__init__(config_group, name, default, parser_type, local)
         self._parser = dispatch_parser(type(self.default))
 
-    def read(self) -> T:
-        """Return value from kritarc parsed to field type."""
-        raw = self.location.read(self.config_group, self.name)
-        if raw is None:
-            return self.default
+    def _parse(self, raw: str) -> T:
+        """Parse the string from save location using parser."""
         return self._parser.parse_to(raw)
 
+    def _copy(self, value: T) -> T:
+        """Copy the value using parser, as only it knows if it's mutable."""
+        return self._parser.copy(value)
+
     def _to_string(self, value: T) -> str:
         """Parse the field value to string using parser."""
         return self._parser.parse_from(value)
@@ -1,8 +1,9 @@
 # SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import TypeVar, Callable, Iterator
+from typing import TypeVar, Callable, Iterator, ContextManager
 
+from .common_utils import Dispatcher, LocalSettings
 from .field import Field
 
 T = TypeVar('T')
@@ -19,10 +20,21 @@ class FieldGroup:
 
     Allows to reset all the fields at once, and register a callback to
     all its fields: both existing and future ones.
+
+    Writing multiple fields inside `transaction()` context runs each
+    affected callback only once, after the last field was written.
+
+    When `pack_local` is set, values of all local fields in the group
+    are stored together in a single .kra annotation. Such documents
+    can't be read by plugin versions older than the packing support.
+    Other groups with the same name, created without `pack_local`, do
+    not change how the group is stored.
     """
 
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, pack_local: bool = False) -> None:
         self.name = name
+        if pack_local:
+            LocalSettings.pack_group(name)
         self._fields: list[Field] = []
         self._callbacks: list[Callable[[], None]] = []
 
@@ -42,8 +54,24 @@ class FieldGroup:
 
     def reset_default(self) -> None:
         """Reset values of all fields stored in this group."""
+        with self.transaction():
+            for field in self._fields:
+                field.reset_default()
+
+    @staticmethod
+    def transaction() -> ContextManager[None]:
+        """Return context in which field callbacks are postponed."""
+        return Dispatcher.transaction()
+
+    def invalidate_cache(self) -> None:
+        """Force all fields in group to read from kritarc on next read."""
         for field in self._fields:
-            field.reset_default()
+            field.invalidate_cache()
+
+    @property
+    def generation(self) -> int:
+        """Return number increased each time any field could change."""
+        return sum(field.generation for field in self._fields)
 
     def register_callback(self, callback: Callable[[], None]) -> None:
         """Register a callback on every past and future field in group."""
@@ -51,6 +79,13 @@ class FieldGroup:
         for field in self._fields:
             field.register_callback(callback)
 
+    def unregister_callback(self, callback: Callable[[], None]) -> None:
+        """Unregister a callback from the group and all its fields."""
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+        for field in self._fields:
+            field.unregister_callback(callback)
+
     def __iter__(self) -> Iterator[Field]:
         """Iterate over all fields in the group."""
         return iter(self._fields)
@@ -8,6 +8,7 @@ from PyQt.QtWidgets import (
     QWidget,
     QLabel)
 
+from ..field_group import FieldGroup
 from .config_based_widget import ConfigBasedWidget
 
 
@@ -69,6 +70,11 @@ class ConfigFormWidget(QWidget):
             element.reset()
 
     def apply(self) -> None:
-        """Write values from stored spin boxes to krita config file."""
-        for element in self.widgets:
-            element.save()
+        """
+        Write values from stored spin boxes to krita config file.
+
+        Callbacks of written fields are run once, after all are saved.
+        """
+        with FieldGroup.transaction():
+            for element in self.widgets:
+                element.save()
@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from PyQt.QtGui import QPixmap, QImage, QColor
+from PyQt.QtGui import QPixmap, QColor
 from api_krita import Krita
 from api_krita.enums import BlendingMode
 from composer_utils.label import LabelText, LabelTextColorizer
@@ -40,12 +40,7 @@ class PresetController(ViewBasedController, Controller[str]):
 
     def get_label(self, value: str) -> QPixmap | None:
         """Return the preset icon or None, when there preset name unknown."""
-        try:
-            image: QImage = Krita.get_presets()[value].image()
-        except KeyError:
-            return None
-        else:
-            return QPixmap.fromImage(image)
+        return Krita.get_preset_thumbnail(value)
 
 
 class BrushSizeController(ViewBasedController, NumericController):
@@ -7,10 +7,15 @@ key_release events.
 """
 
 from dataclasses import dataclass
+from typing import Callable
 
 from PyQt.QtWidgets import QWidgetAction
 
-from .action_manager_utils import Krita, ReleaseKeyEventFilter, ShortcutAdapter
+from .action_manager_utils import (
+    Krita,
+    ReleaseKeyEventFilter,
+    ShortcutAdapter,
+    WarmUpScheduler)
 from .complex_action_interface import ComplexActionInterface
 
 
@@ -34,6 +39,7 @@ class ActionContainer:
 
     def replace_action(self, new_action: ComplexActionInterface) -> None:
         """Replace plugin action managed by this container."""
+        self.core_action.on_replace()
         self.core_action = new_action
         self.shortcut.action = new_action
 
@@ -48,11 +54,29 @@ class ActionManager:
     `QWidgetAction` and `ShortcutAdapter` are created and stored in
     container along with passed `ComplexActionInterfaces` by using the
     bind_action() method.
+
+    Stored actions can be prepared in the background with warm_up(),
+    which gets cancelled as soon as any of the actions is used.
+
+    Actions are prepared starting with the most recently used ones.
+    Their names can be given on initialization, and are passed to the
+    `on_recently_used_change` callback each time their order changes.
+    The passed list is modified in place, so managers of all windows
+    can share a single one.
     """
 
-    def __init__(self, window) -> None:
+    def __init__(
+        self,
+        window,
+        recently_used: list[str] | None = None,
+        on_recently_used_change: Callable[[list[str]], None]
+        = lambda _: None,
+    ) -> None:
         self._window = window
         self._event_filter = ReleaseKeyEventFilter()
+        self._warm_up_scheduler = WarmUpScheduler(
+            recently_used if recently_used is not None else [])
+        self._on_recently_used_change = on_recently_used_change
         self._stored_actions: dict[str, ActionContainer] = {}
 
     def bind_action(self, action: ComplexActionInterface) -> None:
@@ -63,6 +87,7 @@ class ActionManager:
         garbage collector.
         """
         if action.name in self._stored_actions:
+            self._warm_up_scheduler.cancel()
             self._stored_actions[action.name].replace_action(action)
             return
 
@@ -73,8 +98,21 @@ class ActionManager:
                 name=action.name),
             shortcut=self._create_adapter(action))
 
+        def on_trigger() -> None:
+            self._warm_up_scheduler.cancel()
+            if self._warm_up_scheduler.mark_used(action.name):
+                self._on_recently_used_change(
+                    list(self._warm_up_scheduler.recently_used))
+        container.krita_action.triggered.connect(on_trigger)
+
         self._stored_actions[action.name] = container
 
+    def warm_up(self) -> None:
+        """Prepare stored actions in the background when krita is idle."""
+        self._warm_up_scheduler.schedule([
+            container.core_action
+            for container in self._stored_actions.values()])
+
     def _create_adapter(self, action: ComplexActionInterface) \
             -> ShortcutAdapter:
         """
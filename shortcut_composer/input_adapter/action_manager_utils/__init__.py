@@ -6,5 +6,10 @@
 from .api_krita import Krita
 from .shortcut_adapter import ShortcutAdapter
 from .release_key_event_filter import ReleaseKeyEventFilter
+from .warm_up_scheduler import WarmUpScheduler
 
-__all__ = ["Krita", "ShortcutAdapter", "ReleaseKeyEventFilter"]
+__all__ = [
+    "Krita",
+    "ShortcutAdapter",
+    "ReleaseKeyEventFilter",
+    "WarmUpScheduler"]
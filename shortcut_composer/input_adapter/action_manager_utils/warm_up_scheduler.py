@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from collections import deque
+from typing import Callable
+
+from PyQt.QtCore import QTimer
+
+from ..complex_action_interface import ComplexActionInterface
+
+
+class WarmUpScheduler:
+    """
+    Prepares actions in small steps when the application is idle.
+
+    Steps are taken from `warm_up_steps()` of scheduled actions. Only
+    one step is run per event loop iteration by a zero-interval timer,
+    which Qt fires after pending events got processed. This way user
+    input is never delayed by more than a single step.
+
+    Actions are prepared starting with the most recently used ones.
+    Order of usage is kept in memory in passed `recently_used` list,
+    which is modified in place, so it can be shared. The owner can
+    store it to make it outlive the session. Actions which were never
+    used are prepared last, in the order in which they were scheduled.
+    """
+
+    def __init__(self, recently_used: list[str]) -> None:
+        self.recently_used = recently_used
+        self._timer = QTimer()
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._run_step)
+        self._steps: deque[Callable[[], object]] = deque()
+
+    def schedule(self, actions: list[ComplexActionInterface]) -> None:
+        """Replace pending steps with those of given actions and start."""
+        ranks = {name: rank for rank, name in enumerate(self.recently_used)}
+        ordered = sorted(actions, key=lambda a: ranks.get(a.name, len(ranks)))
+
+        self._steps = deque(
+            step for action in ordered for step in action.warm_up_steps())
+        if self._steps:
+            self._timer.start()
+
+    def cancel(self) -> None:
+        """Stop preparing actions and discard the pending steps."""
+        self._timer.stop()
+        self._steps.clear()
+
+    def mark_used(self, name: str) -> bool:
+        """
+        Remember that the action got used, to prepare it first.
+
+        Return whether the order of recently used actions changed.
+        """
+        if self.recently_used and self.recently_used[0] == name:
+            return False
+        if name in self.recently_used:
+            self.recently_used.remove(name)
+        self.recently_used.insert(0, name)
+        return True
+
+    def _run_step(self) -> None:
+        """Run the next pending step. Stop the timer when none is left."""
+        if self._steps:
+            step = self._steps.popleft()
+            step()
+        if not self._steps:
+            self._timer.stop()
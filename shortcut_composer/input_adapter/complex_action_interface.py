@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Protocol
+from typing import Callable, Protocol
 
 
 class ComplexActionInterface(Protocol):
@@ -28,3 +28,9 @@ class ComplexActionInterface(Protocol):
 
     def on_every_key_release(self) -> None:
         """Called on each release of related key, after short/long callback."""
+
+    def on_replace(self) -> None:
+        """Called when action got replaced by a new one, and won't be used."""
+
+    def warm_up_steps(self) -> list[Callable[[], object]]:
+        """Return small steps which prepare the action before its use."""
@@ -6,8 +6,9 @@ from PyQt.QtWidgets import QWidgetAction
 
 from krita import Extension
 from api_krita import Krita
+from api_krita.pyqt import PixmapCache
 from actions import create_actions
-from composer_utils import SettingsDialog
+from composer_utils import SettingsDialog, Config
 from input_adapter import ActionManager
 
 
@@ -40,6 +41,8 @@ class ShortcutComposer(Extension):
         """Add callback to reload actions on theme change."""
         super().__init__(parent)
         self._protectors: list[GarbageProtector] = []
+        # Shared by all windows, so that they do not overwrite its order
+        self._recently_used: list[str] = Config.RECENTLY_USED_ACTIONS.read()
         Krita.add_theme_change_callback(self._reload_composer)
 
     def setup(self) -> None: """Obligatory abstract method override."""
@@ -49,13 +52,19 @@ class ShortcutComposer(Extension):
         self._protectors.append(GarbageProtector(
             settings_dialog=(settings := SettingsDialog()),
             settings_action=self._create_settings_action(window, settings),
-            action_manager=ActionManager(window),
+            action_manager=ActionManager(
+                window=window,
+                recently_used=self._recently_used,
+                on_recently_used_change=Config.RECENTLY_USED_ACTIONS.write),
             reload_action=self._create_reload_action(window)))
 
         self._reload_composer()
 
     def _reload_composer(self) -> None:
         """Reload all core actions for every window."""
+        # Cached pixmaps can be painted for the previous theme
+        PixmapCache.clear()
+
         for protector in reversed(self._protectors):
             if not protector.is_alive():
                 self._protectors.remove(protector)
@@ -63,6 +72,8 @@ class ShortcutComposer(Extension):
         for protector in self._protectors:
             for action in create_actions():
                 protector.action_manager.bind_action(action)
+            if Config.WARM_UP_ACTIONS.read():
+                protector.action_manager.warm_up()
 
     def _create_settings_action(
         self,
@@ -78,11 +78,14 @@ class MultipleAssignment(RawInstructions, Generic[T]):
             value_type=self._controller.TYPE,
             values=values,
             default_value=self._read_default_value(default_value))
+        self._values_generation: tuple[int, int] | None = None
+        self._values_to_cycle: list[T] = []
 
         self._instructions.append(MaSettingsHandler(
             name,
             controller,
-            self._config))
+            self._config,
+            self._callback_scope))
 
     def on_key_press(self) -> None:
         """Switch to the next value or start over when value is not in list."""
@@ -108,12 +111,23 @@ class MultipleAssignment(RawInstructions, Generic[T]):
         self._controller.set_value(self._config.DEFAULT_VALUE.read())
 
     def _reset_values_to_cycle(self) -> list[T]:
-        """Reload values from config and validate them."""
-        if not self._config.GROUP_MODE.read():
-            values = self._config.VALUES.read()
-        else:
+        """
+        Reload values from config and validate them.
+
+        In manual mode, values from previous call are reused when the
+        config did not change since then. Groups come from outside of
+        config, so they are always red.
+        """
+        generation = (
+            self._config.GROUP_MODE.generation,
+            self._config.VALUES.generation)
+        if self._config.GROUP_MODE.read():
             group = self._config.GROUP_NAME.read()
             values = self._group_manager.values_from_group(group)
+        elif generation != self._values_generation:
+            values = self._config.VALUES.read()
+        else:
+            return self._values_to_cycle.copy()
 
         if len(set(values)) != len(values):
             raise ValueError("Values to cycle does not support duplicates.")
@@ -122,7 +136,9 @@ class MultipleAssignment(RawInstructions, Generic[T]):
         if values:
             values.append(values[0])
 
-        return values
+        self._values_generation = generation
+        self._values_to_cycle = values
+        return values.copy()
 
     # TODO: this could be handled by config, if no defualt value is allowed
     def _read_default_value(self, value: T | None) -> T:
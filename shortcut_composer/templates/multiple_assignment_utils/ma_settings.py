@@ -7,6 +7,7 @@ from PyQt.QtGui import QColor
 
 from api_krita import Krita
 from api_krita.enums.helpers import EnumGroup
+from config_system import CallbackScope
 from core_components import Controller
 from composer_utils import ButtonsLayout
 from composer_utils.label.complex_widgets import NumericValuePicker
@@ -39,7 +40,12 @@ class MaSettings(QDialog):
     the value to activate on long key release of action.
     """
 
-    def __init__(self, controller: Controller, config: MaConfig):
+    def __init__(
+        self,
+        controller: Controller,
+        config: MaConfig,
+        callback_scope: CallbackScope,
+    ) -> None:
         super().__init__()
         self.setWindowFlags(
             self.windowFlags() |
@@ -47,6 +53,7 @@ class MaSettings(QDialog):
 
         self._config = config
         self._controller = controller
+        self._callback_scope = callback_scope
         self._label_creator = PieLabelCreator(controller)
         self._group_manager = dispatch_group_manager(controller.TYPE)
 
@@ -67,6 +74,11 @@ class MaSettings(QDialog):
                 0.012 * Krita.screen_size
                 * Config.PIE_GLOBAL_SCALE.read())
 
+        def scale_generation() -> tuple[int, int]:
+            """Return generations of the only fields read by styles."""
+            return (Config.PIE_GLOBAL_SCALE.generation,
+                    Config.PIE_ICON_GLOBAL_SCALE.generation)
+
         active_color = QColor(110, 160, 255)
         background_color = QColor(150, 150, 255)
         self._pie_style = PieWidgetStyle(
@@ -74,15 +86,18 @@ class MaSettings(QDialog):
             desired_icon_radius_callback=desired_pie_label_radius,
             active_color_callback=lambda: active_color,
             background_color_callback=lambda: background_color,
-            background_opacity_callback=lambda: 35)
+            background_opacity_callback=lambda: 35,
+            snapshot_key_callback=scale_generation)
         self._label_style = LabelWidgetStyle(
             icon_radius_callback=desired_pie_label_radius,
             active_color_callback=lambda: active_color,
-            background_color_callback=lambda: background_color)
+            background_color_callback=lambda: background_color,
+            snapshot_key_callback=scale_generation)
         self._small_label_style = LabelWidgetStyle(
             icon_radius_callback=small_label_radius,
             active_color_callback=lambda: active_color,
-            background_color_callback=lambda: background_color)
+            background_color_callback=lambda: background_color,
+            snapshot_key_callback=scale_generation)
 
         self._widget = self._init_widget()
         self._current_value_holder = self._init_current_value_holder()
@@ -122,7 +137,8 @@ class MaSettings(QDialog):
                     self._config.LAST_GROUP_SELECTED),
                 order_handler=self._widget.order_handler,
                 controller=self._controller,
-                label_style=self._label_style)
+                label_style=self._label_style,
+                callback_scope=self._callback_scope)
             core_layout.addWidget(tab)
         elif issubclass(self._controller.TYPE, int):
             def label_from_integer(value: int) -> PieLabel[int]:
@@ -154,8 +170,8 @@ class MaSettings(QDialog):
             self.hide()
             widget.reset_size()
 
-        Config.PIE_GLOBAL_SCALE.register_callback(reset_size)
-        Config.PIE_ICON_GLOBAL_SCALE.register_callback(reset_size)
+        self._callback_scope.register(Config.PIE_GLOBAL_SCALE, reset_size)
+        self._callback_scope.register(Config.PIE_ICON_GLOBAL_SCALE, reset_size)
 
         return widget
 
@@ -173,10 +189,11 @@ class MaSettings(QDialog):
             self._reset_values()
 
         def apply() -> None:
-            self._config.VALUES.write(self._widget.order_handler.values)
-            label = self._holder_of_default.label
-            if label is not None:
-                self._config.DEFAULT_VALUE.write(label.value)
+            with self._config.transaction():
+                self._config.VALUES.write(self._widget.order_handler.values)
+                label = self._holder_of_default.label
+                if label is not None:
+                    self._config.DEFAULT_VALUE.write(label.value)
 
         def ok() -> None:
             apply()
@@ -201,8 +218,10 @@ class MaSettings(QDialog):
             button_size = 2*self._small_label_style.icon_radius
             position = pie_size-button_size
             value_holder.move(QPoint(position, position))
-        Config.PIE_GLOBAL_SCALE.register_callback(move_to_bottom_left)
-        Config.PIE_ICON_GLOBAL_SCALE.register_callback(move_to_bottom_left)
+        self._callback_scope.register(
+            Config.PIE_GLOBAL_SCALE, move_to_bottom_left)
+        self._callback_scope.register(
+            Config.PIE_ICON_GLOBAL_SCALE, move_to_bottom_left)
         move_to_bottom_left()
 
         # Holder must be disabled, when its value is already in pie_widget
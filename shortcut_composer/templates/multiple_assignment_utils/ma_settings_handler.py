@@ -8,6 +8,7 @@ from PyQt.QtWidgets import QWidget
 
 from api_krita import Krita
 from api_krita.pyqt import RoundButton, Timer
+from config_system import CallbackScope
 from core_components import Controller, Instruction
 from .ma_settings import MaSettings
 from .ma_config import MaConfig
@@ -30,10 +31,12 @@ class MaSettingsHandler(Instruction):
         name: str,
         controller: Controller,
         config: MaConfig,
+        callback_scope: CallbackScope,
     ) -> None:
         self._name = name
         self._controller = controller
         self._config = config
+        self._callback_scope = callback_scope
 
         self._button = RoundButton(
             radius_callback=lambda: 25,
@@ -55,7 +58,10 @@ class MaSettingsHandler(Instruction):
 
     @cached_property
     def _settings_window(self) -> QWidget:
-        settings_window = MaSettings(self._controller, self._config)
+        settings_window = MaSettings(
+            self._controller,
+            self._config,
+            self._callback_scope)
         settings_window.setWindowTitle(f"Configure: {self._name}")
         return settings_window
 
@@ -146,12 +146,15 @@ class PieMenu(RawInstructions, Generic[T]):
             max_signs_amount=max_signs_amount,
             abbreviate_with_dot=abbreviate_with_dot)
 
-        self._style_holder = PieStyleHolder(self._config)
+        self._style_holder = PieStyleHolder(
+            config=self._config,
+            callback_scope=self._callback_scope)
         self._label_creator = PieLabelCreator(self._controller)
         self._group_order_holder = GroupOrderHolder(self._controller.TYPE)
 
         self._is_in_edit_mode = False
         self._force_reload = False
+        self._labels_generation: tuple[int, int, int] | None = None
 
         # Usually, when values stay same, recreating widgets is not
         # needed, but when widget scale changes, they have to be
@@ -193,7 +196,8 @@ class PieMenu(RawInstructions, Generic[T]):
             config=self._config,
             style_holder=self._style_holder,
             controller=self._controller,
-            order_handler=self._pie_widget.order_handler)
+            order_handler=self._pie_widget.order_handler,
+            callback_scope=self._callback_scope)
 
         self._register_callback_to_size_change(settings.hide)
         return settings
@@ -348,13 +352,7 @@ class PieMenu(RawInstructions, Generic[T]):
             return
 
         # Read values selected for display from config
-        new_labels = self._label_creator.labels_from_config(self._config)
-        current_labels = self._pie_widget.order_handler.labels
-
-        # Replace labels in pie_widget when values or label size changed
-        if new_labels != current_labels or self._force_reload:
-            self._force_reload = False
-            self._pie_widget.order_handler.replace_labels(new_labels)
+        self._refresh_labels()
 
         # Fill current_value_holder with value from controller
         self._controller.refresh()
@@ -365,11 +363,21 @@ class PieMenu(RawInstructions, Generic[T]):
         else:
             label = self._label_creator.label_from_value(current_value)
         self._current_value_holder.replace(label)
-        self._current_value_holder.enabled = label not in new_labels
+        self._current_value_holder.enabled = (
+            label not in self._pie_widget.order_handler.labels)
 
         # Start tracker which highlights/selects the values under cursor
         self._label_selector.start_tracking()
 
+    def warm_up_steps(self) -> list[Callable[[], object]]:
+        """Return steps creating components used on first key press."""
+        return [
+            lambda: self._pie_widget,
+            lambda: self._settings_button,
+            self._refresh_labels,
+            lambda: self._label_selector,
+            lambda: self._current_value_holder]
+
     def on_every_key_release(self) -> None:
         """Handle the event of user releasing the action key."""
         super().on_every_key_release()
@@ -390,9 +398,43 @@ class PieMenu(RawInstructions, Generic[T]):
             self._controller.set_value(label.value)
             self._config.LAST_VALUE_SELECTED.write(label.value)
 
+    def _refresh_labels(self) -> None:
+        """
+        Replace labels in pie_widget when values or label size changed.
+
+        In manual mode, values come only from config, so reading them is
+        skipped when the config did not change since the last refresh.
+        Validity of preset values depends on krita resources, so preset
+        pies also check whether the presets changed.
+        Groups come from outside of config, so they are always red.
+        """
+        generation = (
+            self._config.GROUP_MODE.generation,
+            self._config.ORDER.generation,
+            self._get_presets_generation())
+        if (generation == self._labels_generation
+                and not self._config.GROUP_MODE.read()
+                and not self._force_reload):
+            return
+        self._labels_generation = generation
+
+        new_labels = self._label_creator.labels_from_config(self._config)
+        current_labels = self._pie_widget.order_handler.labels
+
+        if new_labels != current_labels or self._force_reload:
+            self._force_reload = False
+            self._pie_widget.order_handler.replace_labels(new_labels)
+
+    def _get_presets_generation(self) -> int:
+        """Return generation of krita presets, if pie displays them."""
+        if issubclass(self._controller.TYPE, str):
+            return Krita.presets_generation
+        return 0
+
     def _register_callback_to_size_change(self, callback: Callable[[], None]):
         """Register callback to each config Field related to size."""
         self._config.PIE_RADIUS_SCALE.register_callback(callback)
         self._config.ICON_RADIUS_SCALE.register_callback(callback)
-        Config.PIE_GLOBAL_SCALE.register_callback(callback)
-        Config.PIE_ICON_GLOBAL_SCALE.register_callback(callback)
+        # Global fields outlive the action, so callbacks must be scoped
+        self._callback_scope.register(Config.PIE_GLOBAL_SCALE, callback)
+        self._callback_scope.register(Config.PIE_ICON_GLOBAL_SCALE, callback)
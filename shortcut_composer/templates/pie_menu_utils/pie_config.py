@@ -5,6 +5,7 @@ from typing import Generic, TypeVar
 from PyQt.QtGui import QColor
 from api_krita import Krita
 from core_components import Controller
+from composer_utils import Config
 from config_system import FieldGroup
 from config_system.field_base_impl import DualField, FieldWithEditableDefault
 from data_components import Group, PieDeadzoneStrategy
@@ -19,6 +20,9 @@ class PieConfig(FieldGroup, Generic[T]):
 
     It is initialized with values that become the field defauts.
     Values written to the fields are remembered between sessions.
+
+    Fields saved in .kra are packed in a single annotation per pie,
+    when the user enabled it in the global settings.
     """
 
     def __init__(
@@ -37,7 +41,9 @@ class PieConfig(FieldGroup, Generic[T]):
         max_signs_amount: int,
         abbreviate_with_dot: bool,
     ) -> None:
-        super().__init__(name)
+        super().__init__(
+            name,
+            pack_local=Config.PACK_DOCUMENT_SETTINGS.read())
 
         self.PIE_RADIUS_SCALE = self.field(
             name="Pie scale",
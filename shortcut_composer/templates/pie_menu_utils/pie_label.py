@@ -17,11 +17,10 @@ T = TypeVar("T")
 
 def _create_animation():
     return Animation(
-        update_callback=lambda _: None,
         duration_s_callback=Config.PIE_LABEL_ANIMATION_TIME.read)
 
 
-@dataclass
+@dataclass(slots=True)
 class PieLabel(LabelInterface, Generic[T]):
     """
     Data representing a single value in PieWidget.
@@ -34,6 +33,8 @@ class PieLabel(LabelInterface, Generic[T]):
     - `angle`         -- Angle [°] in relation to widget center. Angles
                          are counted clockwise with 0 being widget top
     - `activation_progress` -- state of animation in range <0-1>
+
+    Attributes are stored in slots, as there can be many labels.
     """
 
     value: Final[T]
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, NamedTuple
+
+from PyQt.QtGui import QPixmap
+
+
+class LabelDisplayData(NamedTuple):
+    """Part of PieLabel which does not change, so it can be shared."""
+
+    display_value: Any
+    pretty_name: str
+
+
+class PieLabelCache:
+    """
+    Least recently used cache of label data, bound by memory it takes.
+
+    Only immutable LabelDisplayData is stored, so that labels created
+    from it share images, but each of them gets its own mutable state.
+
+    Size of pixmaps is computed from their dimensions. Other display
+    values (icons, texts, colors) are estimated with a constant cost.
+
+    Amount of cache hits and misses is counted to allow adjusting the
+    capacity.
+    """
+
+    OTHER_VALUE_COST = 4 * 1024
+    """Estimated amount of bytes taken by display value other than pixmap."""
+
+    def __init__(self, capacity_mb: int) -> None:
+        self._capacity = capacity_mb * 1024 * 1024
+        self._used = 0
+        self._data: OrderedDict[Hashable, LabelDisplayData] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Amount of stored labels data."""
+        return len(self._data)
+
+    @property
+    def capacity_mb(self) -> int:
+        """Return amount of megabytes the cache can take."""
+        return self._capacity // (1024 * 1024)
+
+    @capacity_mb.setter
+    def capacity_mb(self, value: int) -> None:
+        """Set amount of megabytes the cache can take and evict excess."""
+        self._capacity = value * 1024 * 1024
+        self._evict()
+
+    def get(self, key: Hashable) -> LabelDisplayData | None:
+        """Return data stored under the key or None when it is missing."""
+        data = self._data.get(key)
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._data.move_to_end(key)
+        return data
+
+    def put(self, key: Hashable, data: LabelDisplayData) -> None:
+        """Store data under the key, evicting least recently used ones."""
+        old_data = self._data.pop(key, None)
+        if old_data is not None:
+            self._used -= self._size_of(old_data)
+        self._data[key] = data
+        self._used += self._size_of(data)
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove all stored data and reset the counters."""
+        self._data.clear()
+        self._used = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _evict(self) -> None:
+        """Remove least recently used data until capacity is met."""
+        while self._used > self._capacity and len(self._data) > 1:
+            _, data = self._data.popitem(last=False)
+            self._used -= self._size_of(data)
+
+    def _size_of(self, data: LabelDisplayData) -> int:
+        """Return estimated amount of bytes taken by the data."""
+        value = data.display_value
+        if isinstance(value, QPixmap):
+            return value.width() * value.height() * value.depth() // 8
+        return self.OTHER_VALUE_COST
@@ -1,14 +1,15 @@
 # SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Generic, TypeVar, Iterable
+from typing import Callable, Generic, TypeVar, Iterable
 from collections.abc import Hashable
-from copy import copy
 
+from api_krita import Krita
 from core_components import Controller
 from composer_utils import GroupOrderHolder
 from composer_utils.group_manager_impl import dispatch_group_manager
 from .pie_config import PieConfig
+from .pie_label_cache import PieLabelCache, LabelDisplayData
 from .pie_label import PieLabel
 
 T = TypeVar("T")
@@ -23,21 +24,31 @@ class PieLabelCreator(Generic[T]):
     - allows to fetch list of value groups that can be later used to
       create PieLabels
 
-    In `_known_labels` dictionary, labels must be copied before storing
-    and fetching. This way icons and images are not created multiple
-    times, but every user can modify fetched labels without affecting
-    other users.
+    Known labels are stored in `label_cache` shared by all creators.
+    Only their display value and name are stored, and every fetched
+    label is created anew from them. This way icons and images are not
+    created multiple times, but every user can modify fetched labels
+    without affecting other users. The cache is keyed with controller
+    type and value, as controllers may display the same value
+    differently.
+
+    Values known to be invalid are forgotten when krita presets change,
+    as a value can become valid when the related resource gets added.
+    Only creators of preset labels check for that change.
     """
 
-    _known_labels: dict[T, PieLabel[T]] = {}
-    """Dictionary of known labels mapped to their names."""
-    _invalid_values: list[T] = []
-    """List of values, that are known to result in invalid labels."""
+    label_cache = PieLabelCache(capacity_mb=64)
+    """Display data of known labels. Its capacity can be adjusted."""
+    _invalid_values: set[Hashable] = set()
+    """Keys of values, that are known to result in invalid labels."""
+    _presets_generation: int | None = None
+    """Generation of krita presets for which invalid values are known."""
 
     def __init__(self, controller: Controller[T]) -> None:
         self._controller = controller
         self._group_order_holder = GroupOrderHolder(controller.TYPE)
         self._group_manager = dispatch_group_manager(controller.TYPE)
+        self._handles_presets = issubclass(controller.TYPE, str)
 
     def fetch_groups(self) -> list[str]:
         """Return list of value group names."""
@@ -51,20 +62,37 @@ class PieLabelCreator(Generic[T]):
         if not isinstance(value, Hashable):
             return PieLabel.from_value(value, self._controller)
 
-        if value in self._known_labels:
-            return copy(self._known_labels[value])
+        key = (type(self._controller), value)
+        data = self.label_cache.get(key)
+        if data is not None:
+            return PieLabel(
+                value=value,
+                display_value=data.display_value,
+                pretty_name=data.pretty_name)
 
-        if value in self._invalid_values:
+        if self._handles_presets:
+            self._forget_invalid_values_on_presets_change()
+
+        if key in self._invalid_values:
             return None
 
         label = PieLabel.from_value(value, self._controller)
         if label is None:
-            self._invalid_values.append(value)
+            self._invalid_values.add(key)
             return None
 
-        self._known_labels[value] = copy(label)
+        self.label_cache.put(key, LabelDisplayData(
+            display_value=label.display_value,
+            pretty_name=label.pretty_name))
         return label
 
+    def _forget_invalid_values_on_presets_change(self) -> None:
+        """Clear invalid values, when krita presets changed since last."""
+        presets_generation = Krita.presets_generation
+        if presets_generation != PieLabelCreator._presets_generation:
+            PieLabelCreator._presets_generation = presets_generation
+            self._invalid_values.clear()
+
     def labels_from_values(
         self,
         values: Iterable[T]
@@ -73,6 +101,22 @@ class PieLabelCreator(Generic[T]):
         labels = [self.label_from_value(value) for value in values]
         return [label for label in labels if label is not None]
 
+    def values_from_group(self, group: str, sort: bool = True) -> list[T]:
+        """Return values which belong to a group."""
+        return self._group_manager.values_from_group(group, sort)
+
+    def prefetch_values(
+        self,
+        values: list[T],
+        on_finished: Callable[[], None],
+    ) -> None:
+        """Start preparing labels of values in background."""
+        self._group_manager.prefetch(values, on_finished)
+
+    def cancel_prefetch(self) -> None:
+        """Stop preparing labels of values."""
+        self._group_manager.cancel_prefetch()
+
     def labels_from_group(
         self,
         group: str,
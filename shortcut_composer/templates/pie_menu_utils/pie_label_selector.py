@@ -1,9 +1,10 @@
 # SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from PyQt.QtCore import QPoint
 from PyQt.QtGui import QCursor
 
-from api_krita.pyqt import Timer
+from api_krita.pyqt import CursorMoveEventFilter, Timer
 from composer_utils import CirclePoints, Config
 from data_components import PieDeadzoneStrategy
 from .pie_label import PieLabel
@@ -24,8 +25,8 @@ class PieLabelSelector:
     1. call `start_tracking()`:
         - `pie_widget` gets shown under the cursor
         - label at which `PieDeadzoneStrategy` points gets marked
-        - timer starts to call `_handle_cursor()` repeatedly
-    2. `_handle_cursor()` called automatically in short time intervals:
+        - tracker starts to call `_handle_cursor()` on cursor moves
+    2. `_handle_cursor()` called automatically when the cursor moves:
         - internally remember label over which cursor hovers
         - start animation when mouse hovers over a new label
         - if something unexpected happens, call `stop_tracking()`
@@ -33,13 +34,17 @@ class PieLabelSelector:
         - return the last label over which cursor was hovering
         - if there was none, use `PieDeadzoneStrategy` to return a label
     4. call `stop_tracking()`
-        - stop the timer which calls `_handle_cursor()`
+        - stop the tracker which calls `_handle_cursor()`
         - remove mark from label at which `PieDeadzoneStrategy` points
         - forget the last label over which cursor was hovering
 
     select() must be called before stop_tracking(), as the latter clears
     the state of the selector.
 
+    Cursor moves are recognized with an application-wide event filter,
+    which does not see moves outside of krita windows. When enabled in
+    `Config.POLL_PIE_CURSOR`, a timer polling the cursor is used instead.
+
     Public attribute `strategy` can be overwritten to change what label
     is selected with `select()` when cursor was hovering over deadzone.
     """
@@ -56,7 +61,10 @@ class PieLabelSelector:
         self.strategy = initial_strategy
 
         self._hovered_label: PieLabel | None = None
+        self._last_cursor: QPoint | None = None
+        self._event_filter = CursorMoveEventFilter(self._handle_cursor)
         self._timer = Timer(self._handle_cursor, Config.get_sleep_time())
+        self._tracker: CursorMoveEventFilter | Timer = self._event_filter
 
     def start_tracking(self) -> None:
         """Show widget under the mouse and start mouse tracking loop."""
@@ -64,11 +72,16 @@ class PieLabelSelector:
         self._pie_widget.draggable = False
         self._pie_widget.move_center(QCursor().pos())
         self._pie_widget.show()
-        self._timer.start()
+        if Config.POLL_PIE_CURSOR.read():
+            self._tracker = self._timer
+        else:
+            self._tracker = self._event_filter
+        self._tracker.start()
 
     def stop_tracking(self) -> None:
         """Stop the mouse tracking loop."""
-        self._timer.stop()
+        self._tracker.stop()
+        self._last_cursor = None
         self._unmark_all_widgets()
         self._update_hovered(None)
 
@@ -110,7 +123,13 @@ class PieLabelSelector:
         if not self._pie_widget.order_handler:
             return
 
+        # NOTE: Single movement is delivered both to the window and the
+        # widget under the cursor, so repeated positions are skipped.
         cursor = QCursor().pos()
+        if cursor == self._last_cursor:
+            return
+        self._last_cursor = cursor
+
         circle = CirclePoints(self._pie_widget.center_global, 0)
         if circle.distance(cursor) < self._pie_widget.deadzone:
             return self._update_hovered(None)
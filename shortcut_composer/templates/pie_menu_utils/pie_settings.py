@@ -6,6 +6,7 @@ from PyQt.QtWidgets import QVBoxLayout, QTabWidget
 
 from api_krita.pyqt import AnimatedWidget, BaseWidget
 from api_krita.enums.helpers import EnumGroup
+from config_system import CallbackScope
 from composer_utils import Config
 from composer_utils.label.complex_widgets import NumericValuePicker
 from core_components import Controller, NumericController
@@ -36,6 +37,7 @@ class PieSettings(AnimatedWidget, BaseWidget):
         config: PieConfig,
         style_holder: PieStyleHolder,
         order_handler: PieWidgetOrder,
+        callback_scope: CallbackScope,
     ) -> None:
         AnimatedWidget.__init__(
             self,
@@ -70,7 +72,8 @@ class PieSettings(AnimatedWidget, BaseWidget):
                     config.LAST_GROUP_SELECTED),
                 order_handler=order_handler,
                 controller=controller,
-                label_style=style_holder.settings_label_style)
+                label_style=style_holder.settings_label_style,
+                callback_scope=callback_scope)
             self._tab_holder.addTab(tab, "Values")
             self._tab_holder.setCurrentIndex(1)
         elif isinstance(controller, NumericController):
@@ -7,7 +7,7 @@ from PyQt.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QSizePolicy
 
 from api_krita import Krita
 from api_krita.pyqt import SafeConfirmButton
-from config_system import Field
+from config_system import Field, CallbackScope
 from config_system.ui import StringComboBox
 from composer_utils import GroupOrderHolder
 from composer_utils.label import LabelWidgetStyle
@@ -47,12 +47,14 @@ class TabValuesList(QWidget):
         order_handler: PieWidgetOrder,
         controller: Controller,
         label_style: LabelWidgetStyle = LabelWidgetStyle(),
+        callback_scope: CallbackScope | None = None,
         parent: QWidget | None = None
     ) -> None:
         super().__init__(parent)
         self._config = config
         self._order_handler = order_handler
         self._label_style = label_style
+        self._callback_scope = callback_scope
 
         self._group_order_holder = GroupOrderHolder(controller.TYPE)
         self._label_creator = PieLabelCreator(controller)
@@ -113,7 +115,8 @@ class TabValuesList(QWidget):
         """Create scroll area, which marks values used in the pie."""
         scroll_area = ScrollArea(
             label_style=self._label_style,
-            columns=3)
+            columns=3,
+            callback_scope=self._callback_scope)
         policy = scroll_area.sizePolicy()
         policy.setRetainSizeWhenHidden(True)
         scroll_area.setSizePolicy(policy)
@@ -192,13 +195,16 @@ class TabValuesList(QWidget):
                 + self._label_creator.fetch_groups()))
 
         def display_group() -> None:
-            """Update preset widgets with group selected in combobox."""
+            """Load preset widgets of group selected in combobox in chunks."""
             picked_group = manual_combobox.read()
-            labels = self._label_creator.labels_from_group(
+            values = self._label_creator.values_from_group(
                 group=picked_group,
                 sort=False)
-            self._scroll_area.replace_handled_labels(labels)
-            self._scroll_area.apply_search_bar_filter()
+            self._scroll_area.load_handled_values(
+                values=values,
+                create_labels=self._label_creator.labels_from_values,
+                prefetch=self._label_creator.prefetch_values,
+                cancel_prefetch=self._label_creator.cancel_prefetch)
             manual_combobox.save()
         manual_combobox.widget.currentTextChanged.connect(display_group)
         display_group()
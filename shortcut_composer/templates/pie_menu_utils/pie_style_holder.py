@@ -7,6 +7,7 @@ from PyQt.QtGui import QColor
 from api_krita import Krita
 from composer_utils import Config
 from composer_utils.label import LabelWidgetStyle
+from config_system import CallbackScope
 from .pie_config import PieConfig
 from .pie_widget_utils import PieWidgetStyle
 
@@ -21,10 +22,44 @@ class PieStyleHolder:
     Callbacks passed to those style objects are reading values from
     passed PieConfig. When user changes the configuration, GUI elements
     will read updated values.
+
+    Styles reuse their compiled snapshots until `_style_version`
+    changes. It is increased by callbacks of only those fields, which
+    are read by the style callbacks. Callbacks on global fields are
+    registered with passed scope, as those fields outlive the action.
     """
 
-    def __init__(self, config: PieConfig) -> None:
+    def __init__(
+        self,
+        config: PieConfig,
+        callback_scope: CallbackScope
+    ) -> None:
         self._config = config
+        self._style_version = 0
+        for field in (
+            config.PIE_RADIUS_SCALE,
+            config.ICON_RADIUS_SCALE,
+            config.OVERRIDE_DEFAULT_THEME,
+            config.BACKGROUND_COLOR,
+            config.ACTIVE_COLOR,
+            config.PIE_OPACITY,
+            config.MAX_LINES_AMOUNT,
+            config.MAX_SIGNS_AMOUNT,
+            config.ABBREVIATE_WITH_DOT,
+        ):
+            field.register_callback(self._mark_style_outdated)
+        for global_field in (
+            Config.PIE_GLOBAL_SCALE,
+            Config.PIE_ICON_GLOBAL_SCALE,
+            Config.PIE_DEADZONE_GLOBAL_SCALE,
+            Config.OVERRIDE_BACKGROUND_THEME_COLOR,
+            Config.DEFAULT_BACKGROUND_COLOR,
+            Config.OVERRIDE_ACTIVE_THEME_COLOR,
+            Config.DEFAULT_ACTIVE_COLOR,
+            Config.DEFAULT_PIE_OPACITY,
+        ):
+            callback_scope.register(global_field, self._mark_style_outdated)
+
         try:
             qt_scale = int(os.environ["QT_SCALE_FACTOR"])
         except Exception:
@@ -41,7 +76,8 @@ class PieStyleHolder:
             background_color_callback=self._background_color,
             max_lines_amount_callback=self._config.MAX_LINES_AMOUNT.read,
             max_signs_amount_callback=self._config.MAX_SIGNS_AMOUNT.read,
-            abbreviation_sign_callback=self._abbreviation_sign_callback)
+            abbreviation_sign_callback=self._abbreviation_sign_callback,
+            snapshot_key_callback=self._get_style_version)
         """Style of the PieWidget."""
 
         self.settings_label_style = LabelWidgetStyle(
@@ -51,7 +87,8 @@ class PieStyleHolder:
             background_color_callback=self._background_color,
             max_lines_amount_callback=lambda: 3,
             max_signs_amount_callback=lambda: 10,
-            abbreviation_sign_callback=lambda: ".")
+            abbreviation_sign_callback=lambda: ".",
+            snapshot_key_callback=self._get_style_version)
         """Style of labels in the PieSettings."""
 
         self.small_label_style = LabelWidgetStyle(
@@ -61,7 +98,8 @@ class PieStyleHolder:
             background_color_callback=self._background_color,
             max_lines_amount_callback=lambda: 1,
             max_signs_amount_callback=lambda: 3,
-            abbreviation_sign_callback=lambda: "")
+            abbreviation_sign_callback=lambda: "",
+            snapshot_key_callback=self._get_style_version)
         """Style of small label, the size of the settings button."""
 
     @property
@@ -78,6 +116,14 @@ class PieStyleHolder:
             * Config.PIE_GLOBAL_SCALE.read()
             * self._config.PIE_RADIUS_SCALE.read())
 
+    def _mark_style_outdated(self) -> None:
+        """Make styles compile their snapshots again on next access."""
+        self._style_version += 1
+
+    def _get_style_version(self) -> int:
+        """Return number increased each time the styles got outdated."""
+        return self._style_version
+
     def _pie_widget_radius(self) -> int:
         """Return radius of the PieWidget."""
         return round(
@@ -52,7 +52,7 @@ class PieWidget(AnimatedWidget, BaseWidget, Generic[T]):
     Following example contains three values of int and string types.
     Those three values can be dragged around, but no values can be added
     or removed from the widget.
-    The widget is white, and has a random size every time it opens.
+    The widget is white, and has a random size picked on creation.
 
     ```python
     import random
@@ -62,9 +62,10 @@ class PieWidget(AnimatedWidget, BaseWidget, Generic[T]):
     from .pie_widget import PieWidget
     from .pie_widget_utils import PieWidgetStyle
 
+    pie_radius = random.randint(100, 200)
     pie_widget = PieWidget(
         pie_style=PieWidgetStyle(
-            pie_radius_callback=lambda: random.randint(100, 200),
+            pie_radius_callback=lambda: pie_radius,
             active_color_callback=lambda: QColor(255, 255, 255)),
         allowed_types=(str, int))
 
@@ -131,7 +132,10 @@ class PieWidget(AnimatedWidget, BaseWidget, Generic[T]):
     def paintEvent(self, event: QPaintEvent) -> None:
         """Paint the entire widget using the Painter wrapper."""
         with Painter(self, event) as qt_painter:
-            self._painter.paint(qt_painter, self.order_handler.labels)
+            self._painter.paint(
+                painter=qt_painter,
+                labels=self.order_handler.labels,
+                pixel_ratio=self.devicePixelRatioF())
 
     def dragEnterEvent(self, e: QDragEnterEvent) -> None:
         """Allow dragging the widgets while .acceptDrops() == True."""
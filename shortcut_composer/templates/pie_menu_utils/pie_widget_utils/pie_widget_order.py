@@ -2,7 +2,6 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from typing import Iterator, Callable, Any
-from itertools import zip_longest
 
 from PyQt.QtCore import QPoint
 
@@ -47,8 +46,8 @@ class PieWidgetOrder:
 
         self._labels: list[PieLabel] = []
         """Source of truth for the container state."""
-        self._widgets: dict[int, PieLabelWidget] = {}
-        """Widgets wrapping labels mapped to their angle on the pie."""
+        self._widgets: list[PieLabelWidget] = []
+        """Widgets wrapping labels, in the same order as labels."""
         self._on_change_callbacks: list[EmptyCallback] = []
         """Callbacks to run everytime container state changes."""
 
@@ -65,7 +64,7 @@ class PieWidgetOrder:
     @property
     def widgets(self) -> list[PieLabelWidget]:
         """Return list of stored widgets in their order."""
-        return [widget for widget in self._widgets.values()]
+        return self._widgets.copy()
 
     def replace_labels(self, labels: list[PieLabel]) -> None:
         """Replace all current labels with passed ones."""
@@ -106,8 +105,8 @@ class PieWidgetOrder:
         self._labels[idx_b] = label_a
         self._labels[idx_a] = label_b
 
-        self._widgets[label_a.angle] = w_b
-        self._widgets[label_b.angle] = w_a
+        self._widgets[idx_b] = w_a
+        self._widgets[idx_a] = w_b
 
         label_a.angle, label_b.angle = label_b.angle, label_a.angle
         label_a.center, label_b.center = label_b.center, label_a.center
@@ -123,77 +122,84 @@ class PieWidgetOrder:
         return self._labels.index(label)
 
     def label_on_angle(self, angle: float) -> PieLabel:
-        """Return label, which is the closest to given `angle`."""
-        def angle_difference(label_angle: float) -> float:
-            """Return the smallest difference between two angles."""
-            raw_difference = label_angle - angle
-            return abs((raw_difference + 180) % 360 - 180)
-
-        closest = min(self._angles(), key=angle_difference)
-        return self._widgets[closest].label
+        """
+        Return label, which is the closest to given `angle`.
+
+        Labels are spread evenly on the circle starting at 0°, in the
+        order of the container. Index of the closest label can be
+        calculated directly from the angle, without comparing it with
+        every label.
+        """
+        if not self._labels:
+            raise ValueError("No labels in holder.")
+        sector = 360 / len(self._labels)
+        return self._labels[round(angle / sector) % len(self._labels)]
 
     def widget_with_label(self, label: PieLabel) -> PieLabelWidget:
         """Return widget wrapping the label of the same value as given."""
-        for widget in self._widgets.values():
-            if widget.label == label:
-                return widget
-        raise ValueError(f"{label} not in holder.")
+        if label not in self._labels:
+            raise ValueError(f"{label} not in holder.")
+        return self._widgets[self._labels.index(label)]
 
     def register_callback_on_change(self, callback: EmptyCallback) -> None:
         """Register callback called on every change in labels."""
         self._on_change_callbacks.append(callback)
 
     def _reset_widgets(self, labels: list[PieLabel]) -> None:
-        """Ensure the widgets properly represent stored labels."""
+        """
+        Ensure the widgets properly represent stored labels.
+
+        Widgets of labels which remain in the container are reused and
+        only moved to their new position. New widgets are created only
+        for labels that were not displayed before, or when change in
+        amount of labels changed the size of the icons.
+
+        Widgets are matched with labels by identity, as labels with the
+        same value can still differ in displayed representation.
+        """
         # values need to be saved for labels to scale properly
         self._pie_style.amount_of_labels = len(labels)
         for callback in self._on_change_callbacks:
             callback()
 
-        # create new widgets that will replace old ones
-        new_widgets: list[LabelWidget[PieLabel]] = []
-        for label in labels:
-            new_widgets.append(dispatch_label_widget(label)(
-                label=label,
-                label_widget_style=self._pie_style.label_style,
-                parent=self._owner))
-
-        old_widgets = self._widgets.copy()
-        self._widgets.clear()
+        diameter = 2*self._pie_style.label_style.icon_radius
+        pool = {id(widget.label): widget for widget in self._widgets}
 
         circle_points = CirclePoints(
             center=self._owner.center,
             radius=self._pie_style.pie_radius)
         angles_and_centers = circle_points.iterate_over_circle(len(labels))
 
-        # Add new and remove widgets at the same time to minimize artifacts
-        it = zip_longest(old_widgets.values(), new_widgets, angles_and_centers)
-        for old_widget, new_widget, angle_and_center in it:
-            if angle_and_center is not None and new_widget is not None:
-                self._add_widget(new_widget, *angle_and_center)
-
-            if old_widget is not None:
+        new_widgets: list[PieLabelWidget] = []
+        for label, (angle, center) in zip(labels, angles_and_centers):
+            widget = pool.pop(id(label), None)
+            if widget is None or widget.width() != diameter:
+                widget = dispatch_label_widget(label)(
+                    label=label,
+                    label_widget_style=self._pie_style.label_style,
+                    parent=self._owner)
+            self._place_widget(widget, angle, center)
+            new_widgets.append(widget)
+
+        kept = set(map(id, new_widgets))
+        for old_widget in self._widgets:
+            if id(old_widget) not in kept:
                 old_widget.setParent(None)  # type: ignore
+        self._widgets = new_widgets
 
-    def _add_widget(
+    def _place_widget(
         self,
         widget: PieLabelWidget,
         angle: int,
         center: QPoint,
     ) -> None:
-        """Add a new widget to the holder."""
+        """Move the widget of the holder to given position."""
         widget.label.angle = angle
         widget.label.center = center
         widget.draggable = True
-        widget.setParent(self._owner)
-        self._widgets[widget.label.angle] = widget
         widget.move_center(widget.label.center)
         widget.show()
 
-    def _angles(self) -> Iterator[int]:
-        """Iterate over all angles at which LabelWidgets are."""
-        return iter(self._widgets.keys())
-
     def __iter__(self) -> Iterator[PieLabel]:
         """Iterate over all labels in the holder."""
         return iter(self._labels)
@@ -1,48 +1,86 @@
 # SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from PyQt.QtCore import QPoint
-from PyQt.QtGui import QColor
+from PyQt.QtCore import QPoint, Qt
+from PyQt.QtGui import QColor, QPixmap
 
 from api_krita.pyqt import Painter
-from .pie_widget_style import PieWidgetStyle
+from .pie_widget_style import PieWidgetStyle, PieWidgetStyleSnapshot
 from ..pie_label import PieLabel
 
 
 class PieWidgetPainter:
-    """Uses provided painter and parts of widget information to paint it."""
+    """
+    Uses provided painter and parts of widget information to paint it.
+
+    Static layers (deadzone indicator, base wheel with its border and
+    decorator) are rendered once into a pixmap, which is then reused
+    until the compiled style, amount of labels or pixel ratio change.
+    Only the animated pies are painted on top of it every frame.
+    """
 
     def __init__(self, style: PieWidgetStyle) -> None:
         self._style = style
+        self._snapshot: PieWidgetStyleSnapshot
+
+        self._background: QPixmap | None = None
+        self._background_key: tuple | None = None
 
-    def paint(self, painter: Painter, labels: list[PieLabel]) -> None:
+    def paint(
+        self,
+        painter: Painter,
+        labels: list[PieLabel],
+        pixel_ratio: float = 1.0,
+    ) -> None:
         """Paint the widget which created the passed painter."""
-        self._painter = painter
         self._labels = labels
+        self._snapshot = self._style.snapshot
 
-        self._paint_deadzone_indicator()
-        self._paint_base_wheel()
+        painter.paint_layer(self._get_background(pixel_ratio))
+
+        self._painter = painter
         self._paint_active_pie()
 
+    def _get_background(self, pixel_ratio: float) -> QPixmap:
+        """Return pixmap with static layers, rendering it when outdated."""
+        key = (self._snapshot, len(self._labels), pixel_ratio)
+        if self._background is not None and key == self._background_key:
+            return self._background
+
+        size = round(2 * self._snapshot.widget_radius * pixel_ratio)
+        background = QPixmap(size, size)
+        background.setDevicePixelRatio(pixel_ratio)
+        background.fill(Qt.GlobalColor.transparent)
+
+        with Painter(background) as painter:
+            self._painter = painter
+            self._paint_deadzone_indicator()
+            self._paint_base_wheel()
+
+        self._background = background
+        self._background_key = key
+        return background
+
     @property
     def _center(self) -> QPoint:
         """Return point with center widget's point in its coordinates."""
-        return QPoint(self._style.widget_radius, self._style.widget_radius)
+        radius = self._snapshot.widget_radius
+        return QPoint(radius, radius)
 
     def _paint_deadzone_indicator(self) -> None:
         """Paint the circle representing deadzone, when its valid."""
-        if self._style.deadzone_radius == float("inf"):
+        if self._snapshot.deadzone_radius == float("inf"):
             return
 
         self._painter.paint_wheel(
             center=self._center,
-            outer_radius=self._style.deadzone_radius,
+            outer_radius=self._snapshot.deadzone_radius,
             color=QColor(128, 255, 128, 120),
             thickness=1)
 
         self._painter.paint_wheel(
             center=self._center,
-            outer_radius=self._style.deadzone_radius-1,
+            outer_radius=self._snapshot.deadzone_radius-1,
             color=QColor(255, 128, 128, 120),
             thickness=1)
 
@@ -52,32 +90,32 @@ class PieWidgetPainter:
         # of the widget, so a low opacity circle allows to trick it.
         self._painter.paint_wheel(
             center=self._center,
-            outer_radius=self._style.widget_radius,
+            outer_radius=self._snapshot.widget_radius,
             color=QColor(128, 128, 128, 1))
 
         # base wheel
         self._painter.paint_wheel(
             center=self._center,
-            outer_radius=self._style.pie_radius,
-            color=self._style.background_color,
-            thickness=self._style.area_thickness
-            + self._style.border_thickness//2)
+            outer_radius=self._snapshot.pie_radius,
+            color=self._snapshot.background_color,
+            thickness=self._snapshot.area_thickness
+            + self._snapshot.border_thickness//2)
 
         # base wheel border
         self._painter.paint_wheel(
             center=self._center,
-            outer_radius=self._style.inner_edge_radius,
-            color=self._style.border_color,
-            thickness=self._style.border_thickness)
+            outer_radius=self._snapshot.inner_edge_radius,
+            color=self._snapshot.border_color,
+            thickness=self._snapshot.border_thickness)
 
         # base wheel decorator
         self._painter.paint_wheel(
             center=self._center,
             outer_radius=(
-                self._style.inner_edge_radius
-                + self._style.decorator_thickness),
-            color=self._style.background_decorator_color,
-            thickness=self._style.decorator_thickness)
+                self._snapshot.inner_edge_radius
+                + self._snapshot.decorator_thickness),
+            color=self._snapshot.background_decorator_color,
+            thickness=self._snapshot.decorator_thickness)
 
     def _paint_active_pie(self) -> None:
         """Paint a pie behind a label which is active or during animation."""
@@ -87,41 +125,41 @@ class PieWidgetPainter:
 
             thickness_addition = round(
                 0.15 * label.activation_progress.value
-                * self._style.area_thickness)
+                * self._snapshot.area_thickness)
 
             # active pie
             self._painter.paint_pie(
                 center=self._center,
-                outer_radius=self._style.pie_radius + thickness_addition,
+                outer_radius=self._snapshot.pie_radius + thickness_addition,
                 angle=label.angle,
                 span=360//len(self._labels),
                 color=self._pick_pie_color(label),
-                thickness=self._style.area_thickness + thickness_addition)
+                thickness=self._snapshot.area_thickness + thickness_addition)
 
             # pie decorator
             self._painter.paint_pie(
                 center=self._center,
-                outer_radius=self._style.pie_radius + thickness_addition,
+                outer_radius=self._snapshot.pie_radius + thickness_addition,
                 angle=label.angle,
                 span=360//len(self._labels),
-                color=self._style.pie_decorator_color,
-                thickness=self._style.border_thickness*4)
+                color=self._snapshot.pie_decorator_color,
+                thickness=self._snapshot.border_thickness*4)
 
             # active pie border
             self._painter.paint_pie(
                 center=self._center,
-                outer_radius=self._style.pie_radius +
-                thickness_addition + self._style.border_thickness//2,
+                outer_radius=self._snapshot.pie_radius +
+                thickness_addition + self._snapshot.border_thickness//2,
                 angle=label.angle,
                 span=360//len(self._labels),
-                color=self._style.active_color_dark,
-                thickness=self._style.border_thickness)
+                color=self._snapshot.active_color_dark,
+                thickness=self._snapshot.border_thickness)
 
     def _pick_pie_color(self, label: PieLabel) -> QColor:
         """Pick color of pie based on widget mode and animation progress."""
         return self._overlay_colors(
-            self._style.active_color_dark,
-            self._style.active_color,
+            self._snapshot.active_color_dark,
+            self._snapshot.active_color,
             opacity=label.activation_progress.value)
 
     @staticmethod
@@ -1,7 +1,8 @@
 # SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Callable
+from dataclasses import dataclass
+from typing import Callable, Hashable
 from math import pi
 
 from PyQt.QtGui import QColor
@@ -10,12 +11,37 @@ from api_krita import Krita
 from composer_utils.label import LabelWidgetStyle
 
 
+@dataclass(frozen=True)
+class PieWidgetStyleSnapshot:
+    """Immutable values of PieWidgetStyle compiled from its callbacks."""
+
+    pie_radius: int
+    deadzone_radius: float
+    widget_radius: int
+    border_thickness: int
+    decorator_thickness: int
+    area_thickness: int
+    inner_edge_radius: int
+    active_color: QColor
+    background_color: QColor
+    active_color_dark: QColor
+    border_color: QColor
+    background_decorator_color: QColor
+    pie_decorator_color: QColor
+
+
 class PieWidgetStyle:
     """
     Style which allows to paint a PieWidget.
 
     Callbacks passed in init determine base values. Rest of the values
     are calculated using those base values.
+
+    Values are compiled into an immutable snapshot, reused until the
+    amount of labels, the theme, or the key returned by
+    `snapshot_key_callback` changes, or until `mark_outdated()` is
+    called. Without the key callback, callbacks are expected to return
+    the same values as long as the theme does not change.
     """
 
     def __init__(
@@ -40,19 +66,25 @@ class PieWidgetStyle:
         = lambda: 8,
         abbreviation_sign_callback: Callable[[], str]
         = lambda: ".",
+        snapshot_key_callback: Callable[[], Hashable] = lambda: None,
     ) -> None:
 
         self._pie_radius_callback = pie_radius_callback
         self._desired_icon_radius_callback = desired_icon_radius_callback
         self._deadzone_radius_callback = deadzone_radius_callback
         self._background_opacity_callback = background_opacity_callback
+        self._snapshot_key_callback = snapshot_key_callback
 
         def icon_radius() -> int:
             desired_radius = self._desired_icon_radius_callback()
             if not self.amount_of_labels:
                 return desired_radius
-            max_radius = round(self.pie_radius * pi / self.amount_of_labels)
+            pie_radius = self._pie_radius_callback()
+            max_radius = round(pie_radius * pi / self.amount_of_labels)
             return min(desired_radius, max_radius)
+
+        def label_snapshot_key() -> Hashable:
+            return (self._snapshot_key_callback(), self.amount_of_labels)
         self.label_style = LabelWidgetStyle(
             icon_radius_callback=icon_radius,
             border_thickness_callback=border_thickness_callback,
@@ -61,82 +93,125 @@ class PieWidgetStyle:
             max_lines_amount_callback=max_lines_amount_callback,
             max_signs_amount_callback=max_signs_amount_callback,
             abbreviation_sign_callback=abbreviation_sign_callback,
-        )
+            snapshot_key_callback=label_snapshot_key)
 
         # Amount of labels in the pie that can be used by the callbacks
         # PieWidgetOrder is responsible for keeping this value correct
         self.amount_of_labels = 0
 
+        self._snapshot: PieWidgetStyleSnapshot | None = None
+        self._snapshot_key: Hashable = None
+
+    @property
+    def snapshot(self) -> PieWidgetStyleSnapshot:
+        """Return compiled values of the style, recompiled when outdated."""
+        key = (
+            Krita.palette_key,
+            self.amount_of_labels,
+            self._snapshot_key_callback())
+        if self._snapshot is None or key != self._snapshot_key:
+            self._snapshot = self._compile()
+            self._snapshot_key = key
+        return self._snapshot
+
+    def mark_outdated(self) -> None:
+        """Make the snapshots compile again on next access."""
+        self._snapshot = None
+        self.label_style.mark_outdated()
+
+    def _compile(self) -> PieWidgetStyleSnapshot:
+        """Evaluate all the callbacks and derive the remaining values."""
+        label_snapshot = self.label_style.snapshot
+        pie_radius = self._pie_radius_callback()
+        border_thickness = label_snapshot.border_thickness
+        area_thickness = round(pie_radius*0.4)
+
+        opaque = label_snapshot.background_color
+        background_color = QColor(
+            opaque.red(),
+            opaque.green(),
+            opaque.blue(),
+            round(self._background_opacity_callback() * 255/100))
+
+        dark = label_snapshot.active_color_dark
+        return PieWidgetStyleSnapshot(
+            pie_radius=pie_radius,
+            deadzone_radius=self._deadzone_radius_callback(),
+            widget_radius=pie_radius + self._desired_icon_radius_callback(),
+            border_thickness=border_thickness,
+            decorator_thickness=border_thickness*4,
+            area_thickness=area_thickness,
+            inner_edge_radius=pie_radius - area_thickness,
+            active_color=label_snapshot.active_color,
+            background_color=background_color,
+            active_color_dark=dark,
+            border_color=label_snapshot.border_color,
+            background_decorator_color=QColor(
+                opaque.red()-5, opaque.green()-5, opaque.blue()-5, 60),
+            pie_decorator_color=QColor(
+                dark.red()-5, dark.green()-5, dark.blue()-5, 60))
+
     @property
     def pie_radius(self) -> int:
         """Radius of the pie, excluding the icons."""
-        return self._pie_radius_callback()
+        return self.snapshot.pie_radius
 
     @property
     def deadzone_radius(self) -> float:
         """Radius of the deadzone in the center."""
-        return self._deadzone_radius_callback()
+        return self.snapshot.deadzone_radius
 
     @property
     def widget_radius(self) -> int:
         """Radius of the entire widget, including base and the icons."""
-        return self.pie_radius + self._desired_icon_radius_callback()
+        return self.snapshot.widget_radius
 
     @property
     def border_thickness(self) -> int:
         """Thickness of border of the pie."""
-        return self.label_style.border_thickness
+        return self.snapshot.border_thickness
 
     @property
     def decorator_thickness(self) -> int:
         """Thickness of decorators near edges."""
-        return self.border_thickness*4
+        return self.snapshot.decorator_thickness
 
     @property
     def area_thickness(self) -> int:
         """Thickness of the base area of pie menu."""
-        return round(self.pie_radius*0.4)
+        return self.snapshot.area_thickness
 
     @property
     def inner_edge_radius(self) -> int:
         """Radius at which the base area starts."""
-        return self.pie_radius - self.area_thickness
+        return self.snapshot.inner_edge_radius
 
     @property
     def active_color(self) -> QColor:
         """Color of active elements."""
-        return self.label_style.active_color
+        return self.snapshot.active_color
 
     @property
     def background_color(self) -> QColor:
         """Color of the widget background."""
-        opaque = self.label_style.background_color
-        return QColor(
-            opaque.red(),
-            opaque.green(),
-            opaque.blue(),
-            round(self._background_opacity_callback() * 255/100))
+        return self.snapshot.background_color
 
     @property
     def active_color_dark(self) -> QColor:
         """Color variation of active element."""
-        return self.label_style.active_color_dark
+        return self.snapshot.active_color_dark
 
     @property
     def border_color(self) -> QColor:
         """Color of the active pie border."""
-        return self.label_style.border_color
+        return self.snapshot.border_color
 
     @property
     def background_decorator_color(self) -> QColor:
         """Color of decorator near inner edge."""
-        color = self.label_style.background_color
-        color = QColor(color.red()-5, color.green()-5, color.blue()-5, 60)
-        return color
+        return self.snapshot.background_decorator_color
 
     @property
     def pie_decorator_color(self) -> QColor:
         """Color of pie decorator near outer pie edge."""
-        color = self.active_color_dark
-        color = QColor(color.red()-5, color.green()-5, color.blue()-5, 60)
-        return color
+        return self.snapshot.pie_decorator_color
@@ -1,6 +1,9 @@
 # SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from typing import Callable
+
+from config_system import CallbackScope
 from composer_utils import Config
 from core_components import InstructionHolder, Instruction
 from input_adapter import ComplexActionInterface
@@ -43,6 +46,7 @@ class RawInstructions(ComplexActionInterface):
         self.short_vs_long_press_time = Config.SHORT_VS_LONG_PRESS_TIME.read()
         self._instructions = InstructionHolder(
             instructions if instructions is not None else [])
+        self._callback_scope = CallbackScope()
 
     def on_key_press(self) -> None:
         """Run instructions meant for key press event."""
@@ -59,3 +63,11 @@ class RawInstructions(ComplexActionInterface):
     def on_every_key_release(self) -> None:
         """Run instructions meant for key release event after short time."""
         self._instructions.on_every_key_release()
+
+    def warm_up_steps(self) -> list[Callable[[], object]]:
+        """Return steps which prepare the action. Nothing to prepare."""
+        return []
+
+    def on_replace(self) -> None:
+        """Unregister callbacks which action registered on global config."""
+        self._callback_scope.release()
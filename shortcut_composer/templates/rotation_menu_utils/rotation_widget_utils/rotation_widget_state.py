@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from enum import Enum, auto
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from collections import defaultdict
 
 from api_krita.pyqt import Animation
@@ -20,19 +20,20 @@ class Zone(Enum):
     """Zone in which angles are being red precisely."""
 
 
-@dataclass
+@dataclass(slots=True)
 class WidgetState:
     """Represents current state of the widget."""
 
     selected_angle: int = 0
     selected_zone: Zone = Zone.DEADZONE
+    current_animation: Animation = field(init=False)
+    """Animation of the intervallic pie under the cursor."""
+    animations_in_progress: defaultdict[int, Animation] = field(init=False)
+    """State of animations for each intervallic pie."""
 
     def __post_init__(self) -> None:
         self.current_animation = self._create_animation()
-        """Animation of the intervallic pie under the cursor."""
-
         self.animations_in_progress = defaultdict(self._create_animation)
-        """State of animations for each intervallic pie."""
 
     def reset(self) -> None:
         """Reset the state to starting value."""
@@ -44,5 +45,4 @@ class WidgetState:
     def _create_animation() -> Animation:
         """Return new animation of the intervallic pie."""
         return Animation(
-            lambda _: None,
-            Config.PIE_LABEL_ANIMATION_TIME.read)
+            duration_s_callback=Config.PIE_LABEL_ANIMATION_TIME.read)
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: © 2022-2026 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from typing import Callable
 from functools import cached_property
 
 from PyQt.QtWidgets import QWidget
@@ -174,6 +175,12 @@ class RotationSelector(RawInstructions):
             self._global_settings_button.move(
                 mdiArea.mapToGlobal(mdiArea.pos()))
 
+    def warm_up_steps(self) -> list[Callable[[], object]]:
+        """Return steps creating components used on first key press."""
+        return [
+            lambda: self._settings_button,
+            lambda: self._global_settings_button]
+
     def on_every_key_release(self) -> None:
         """Handle the key release event."""
         super().on_every_key_release()